@@ -0,0 +1,56 @@
+"""
+Compara os backends de avaliação com um objetivo artificialmente caro.
+
+Uso, a partir da raiz do repositório:
+    python -m comum.benchmark_evaluators
+"""
+import os
+import time
+
+import numpy as np
+
+from comum.evaluators import SerialEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator
+
+
+def expensive_sphere(point):
+    # Laço em Python puro para simular uma chamada cara (segura o GIL)
+    total = 0.0
+    for _ in range(500):
+        for value in point:
+            total += value * value
+    return total / 500
+
+
+def time_generation(evaluator, population, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        values = evaluator.map(expensive_sphere, population)
+    elapsed = (time.perf_counter() - start) / repeats
+    assert np.allclose(values, np.sum(population**2, axis=1))  # ordem preservada
+    return elapsed
+
+
+def main():
+    np.random.seed(42)
+    POP_SIZE = 256
+    DIMENSIONS = 30
+    REPEATS = 3
+    population = np.random.uniform(-100, 100, (POP_SIZE, DIMENSIONS))
+
+    with SerialEvaluator() as evaluator:
+        serial = time_generation(evaluator, population, REPEATS)
+    print(f"{'backend':>8} | {'workers':>7} | {'s/geração':>10} | {'speedup':>7}")
+    print(f"{'serial':>8} | {1:>7} | {serial:>10.3f} | {1.0:>7.2f}")
+
+    workers = 1
+    while workers <= os.cpu_count():
+        for name, backend in (("threads", ThreadPoolEvaluator), ("process", ProcessPoolEvaluator)):
+            with backend(workers) as evaluator:
+                evaluator.map(expensive_sphere, population[:workers])  # sobe o pool fora da medição
+                elapsed = time_generation(evaluator, population, REPEATS)
+            print(f"{name:>8} | {workers:>7} | {elapsed:>10.3f} | {serial / elapsed:>7.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
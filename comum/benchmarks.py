@@ -0,0 +1,143 @@
+import numpy as np
+
+from comum.objective import Separable
+
+
+class Benchmark:
+    """
+    Metadados de uma função de teste: domínio usual [lower, upper] em
+    cada eixo e coordenada do mínimo global, repetida em todas as
+    dimensões. As funções seguem o protocolo em lote de comum.objective:
+    recebem (..., D), com as coordenadas no último eixo, e devolvem (...).
+    """
+    name = ""
+    lower = -1.0
+    upper = 1.0
+    optimum_coordinate = 0.0
+
+    def bounds(self, num_dimensions: int):
+        # (lower, upper) como vetores de D posições
+        return np.full(num_dimensions, self.lower), np.full(num_dimensions, self.upper)
+
+    def optimum(self, num_dimensions: int) -> np.ndarray:
+        return np.full(num_dimensions, self.optimum_coordinate)
+
+    def fmin(self, num_dimensions: int) -> float:
+        # Valor no mínimo global calculado pela própria função (a constante
+        # 418.9829 da Schwefel, por exemplo, deixa um resíduo de ~1e-5 por eixo)
+        return float(self(self.optimum(num_dimensions)))
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class _DimensionCache:
+    """Constantes por dimensão (como 1/sqrt(i)) calculadas uma vez e reaproveitadas."""
+
+    def __init__(self, func):
+        self.func = func
+        self.values = func(np.arange(0))
+
+    def __getitem__(self, dims: np.ndarray) -> np.ndarray:
+        size = int(np.max(dims, initial=-1)) + 1
+        if size > len(self.values):
+            self.values = self.func(np.arange(max(size, 2 * len(self.values))))
+        return self.values[dims]
+
+
+def _inverse_sqrt(dims: np.ndarray) -> np.ndarray:
+    # Função de módulo, não lambda: o benchmark precisa ser serializável para pools de processos
+    return 1 / np.sqrt(dims + 1)
+
+
+class Sphere(Separable, Benchmark):
+    # sum(x_i²)
+    name = "Sphere"
+    lower, upper = -100.0, 100.0
+    reductions = ("sum",)
+
+    def terms(self, values, dims):
+        return (values * values)[..., None]
+
+    def combine(self, aggregates, num_dimensions):
+        return aggregates[..., 0]
+
+
+class Rastrigin(Separable, Benchmark):
+    # 10·D + sum(x_i² - 10·cos(2π·x_i))
+    name = "Rastrigin"
+    lower, upper = -5.12, 5.12
+    reductions = ("sum",)
+
+    def terms(self, values, dims):
+        return (values * values - 10 * np.cos(2 * np.pi * values))[..., None]
+
+    def combine(self, aggregates, num_dimensions):
+        return 10 * num_dimensions + aggregates[..., 0]
+
+
+class Schwefel(Separable, Benchmark):
+    # 418.9829·D - sum(x_i·sin(sqrt|x_i|))
+    name = "Schwefel"
+    lower, upper = -500.0, 500.0
+    optimum_coordinate = 420.9687
+    reductions = ("sum",)
+
+    def terms(self, values, dims):
+        return (values * np.sin(np.sqrt(np.abs(values))))[..., None]
+
+    def combine(self, aggregates, num_dimensions):
+        return 418.9829 * num_dimensions - aggregates[..., 0]
+
+
+class Griewank(Separable, Benchmark):
+    # sum(x_i²)/4000 - prod(cos(x_i/sqrt(i))) + 1
+    name = "Griewank"
+    lower, upper = -600.0, 600.0
+    reductions = ("sum", "prod")
+
+    def __init__(self):
+        self.inverse_sqrt = _DimensionCache(_inverse_sqrt)
+
+    def terms(self, values, dims):
+        return np.stack([values * values / 4000, np.cos(values * self.inverse_sqrt[dims])], axis=-1)
+
+    def combine(self, aggregates, num_dimensions):
+        return aggregates[..., 0] - aggregates[..., 1] + 1
+
+
+class Ackley(Separable, Benchmark):
+    # -20·exp(-0.2·sqrt(sum(x_i²)/D)) - exp(sum(cos(2π·x_i))/D) + 20 + e
+    name = "Ackley"
+    lower, upper = -32.768, 32.768
+    reductions = ("sum", "sum")
+
+    def terms(self, values, dims):
+        return np.stack([values * values, np.cos(2 * np.pi * values)], axis=-1)
+
+    def combine(self, aggregates, num_dimensions):
+        return (-20 * np.exp(-0.2 * np.sqrt(aggregates[..., 0] / num_dimensions))
+                - np.exp(aggregates[..., 1] / num_dimensions) + 20 + np.e)
+
+
+class Rosenbrock(Benchmark):
+    # sum(100·(x_{i+1} - x_i²)² + (1 - x_i)²); acopla eixos vizinhos, logo não é Separable
+    name = "Rosenbrock"
+    lower, upper = -5.0, 10.0
+    optimum_coordinate = 1.0
+    batch = True
+
+    def __call__(self, points):
+        points = np.asarray(points)
+        head, tail = points[..., :-1], points[..., 1:]
+        return np.sum(100 * (tail - head * head) ** 2 + (1 - head) ** 2, axis=-1)
+
+
+sphere = Sphere()
+rastrigin = Rastrigin()
+schwefel = Schwefel()
+griewank = Griewank()
+ackley = Ackley()
+rosenbrock = Rosenbrock()
+
+BENCHMARKS = {f.name.lower(): f for f in (sphere, rastrigin, schwefel, griewank, ackley, rosenbrock)}
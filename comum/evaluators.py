@@ -0,0 +1,74 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+
+from comum.objective import is_batch
+
+
+def _evaluate_chunk(func, chunk):
+    # Objetivos em lote recebem o pedaço inteiro numa chamada
+    if is_batch(func):
+        return list(func(chunk))
+    return [func(point) for point in chunk]
+
+
+class SerialEvaluator:
+    """
+    Avalia os candidatos um a um no próprio processo.
+    """
+    def map(self, func, points) -> list:
+        return _evaluate_chunk(func, points)
+
+    def close(self):
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _PoolEvaluator(SerialEvaluator):
+    """
+    Divide os candidatos de uma geração em pedaços e os avalia num pool.
+    Os resultados voltam na ordem dos candidatos, então execuções com
+    semente continuam reprodutíveis.
+    """
+    executor_class = None
+
+    def __init__(self, workers: int = None, chunksize: int = None):
+        self.workers = workers or os.cpu_count()
+        self.chunksize = chunksize
+        self._executor = None
+
+    def map(self, func, points) -> list:
+        if self._executor is None:
+            self._executor = self.executor_class(max_workers=self.workers)
+
+        chunksize = self.chunksize or math.ceil(len(points) / self.workers)
+        chunks = [points[i:i + chunksize] for i in range(0, len(points), chunksize)]
+        results = self._executor.map(_evaluate_chunk, [func] * len(chunks), chunks)
+        return list(chain.from_iterable(results))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """
+    Pool de threads: útil quando o objetivo libera o GIL (NumPy, E/S,
+    chamadas a simuladores externos).
+    """
+    executor_class = ThreadPoolExecutor
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """
+    Pool de processos: o objetivo precisa ser serializável com pickle
+    (função de módulo, não lambda).
+    """
+    executor_class = ProcessPoolExecutor
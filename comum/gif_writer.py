@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+from PIL import GifImagePlugin, Image
+
+
+class FrameWriter(ABC):
+    """
+    Escritor incremental de quadros: cada append() converte o quadro e o
+    grava na saída imediatamente, então a memória usada não cresce com o
+    número de quadros (imageio.mimsave e o writer de GIF do imageio
+    guardam todos os quadros até o close()).
+
+    Opções aplicadas a cada quadro:
+
+    - every: grava só 1 a cada every quadros recebidos;
+    - scale: fator de redução (0.5 grava com metade da largura e altura);
+    - rgb: descarta o canal alfa do buffer RGBA do matplotlib.
+    """
+    def __init__(self, path, fps: float = 10, every: int = 1, scale: float = 1.0, rgb: bool = True):
+        self.path = path
+        self.fps = fps
+        self.every = max(1, int(every))
+        self.scale = scale
+        self.rgb = rgb
+        self.received = 0  # quadros recebidos
+        self.written = 0   # quadros gravados
+
+    def append(self, frame: np.ndarray):
+        index = self.received
+        self.received += 1
+        if index % self.every:
+            return
+        self._write(self._prepare(frame))
+        self.written += 1
+
+    def _prepare(self, frame: np.ndarray) -> Image.Image:
+        frame = np.asarray(frame)
+        if self.rgb and frame.ndim == 3 and frame.shape[-1] == 4:
+            frame = frame[..., :3]
+        image = Image.fromarray(np.ascontiguousarray(frame))
+        if self.scale != 1.0:
+            size = (max(1, round(image.width * self.scale)), max(1, round(image.height * self.scale)))
+            image = image.resize(size, Image.Resampling.BOX)  # média por área: barata e sem serrilhado
+        return image
+
+    @abstractmethod
+    def _write(self, image: Image.Image):
+        ...
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GifWriter(FrameWriter):
+    """
+    GIF gravado quadro a quadro com as funções getheader/getdata do
+    Pillow. Cada quadro é quantizado para colors cores:
+
+    - palette="frame": paleta própria por quadro (tabela de cores local);
+    - palette="first": todos os quadros usam a paleta do primeiro, o que
+      dá arquivos menores e cores estáveis quando o fundo não muda.
+
+    Com delta=True cada quadro grava só o retângulo que mudou em relação
+    ao anterior (o resto da imagem é mantido pelo visualizador), como faz
+    o save do Pillow, mas sem guardar a sequência inteira.
+    """
+    def __init__(self, path, fps: float = 10, every: int = 1, scale: float = 1.0, rgb: bool = True,
+                 colors: int = 256, palette: str = "frame", dither: bool = False, loop: int = 0,
+                 delta: bool = True, method=Image.Quantize.FASTOCTREE):
+        super().__init__(path, fps, every, scale, rgb)
+        self.colors = colors
+        self.palette = palette
+        self.dither = Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE
+        self.loop = loop
+        self.delta = delta
+        self.method = method  # FASTOCTREE: ~3x mais rápido que MEDIANCUT em quadros do matplotlib
+        self.duration = round(1000 / fps)  # milissegundos por quadro
+        self._file = open(path, "wb")
+        self._first = None  # quadro de referência da paleta "first"
+        self._previous = None  # pixels do último quadro gravado, para o delta
+
+    def _quantize(self, image: Image.Image) -> Image.Image:
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        if self.palette == "first" and self._first is not None:
+            return image.quantize(palette=self._first, dither=self.dither)
+        return image.quantize(self.colors, method=self.method, dither=self.dither)
+
+    def _changed_box(self, pixels: np.ndarray):
+        # Menor retângulo (x0, y0, x1, y1) com pixels diferentes do quadro anterior
+        changed = pixels != self._previous
+        if changed.ndim == 3:
+            changed = changed.any(axis=-1)
+        rows = np.flatnonzero(changed.any(axis=1))
+        if not rows.size:
+            return 0, 0, 1, 1  # quadro repetido: um pixel mantém a duração
+        cols = np.flatnonzero(changed.any(axis=0))
+        return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+    def _write(self, image: Image.Image):
+        pixels = np.asarray(image)
+        offset = (0, 0)
+        if self.delta and self._previous is not None and self._previous.shape == pixels.shape:
+            box = self._changed_box(pixels)
+            offset = box[:2]
+            image = image.crop(box)
+        self._previous = pixels
+
+        frame = self._quantize(image)
+        if self._first is None:
+            self._first = frame
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": self.loop, "duration": self.duration,
+                                                              "optimize": False})
+            self._file.write(b"".join(header))
+            include_color_table = False  # o primeiro quadro usa a tabela global do cabeçalho
+        else:
+            include_color_table = self.palette != "first"
+        for block in GifImagePlugin.getdata(frame, offset, duration=self.duration,
+                                            include_color_table=include_color_table):
+            self._file.write(block)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(b";")  # trailer do GIF
+            self._file.close()
+
+
+class VideoWriter(FrameWriter):
+    # Outros formatos (mp4, ...) pelo writer do imageio, que com o ffmpeg envia cada quadro ao encoder
+    def __init__(self, path, fps: float = 10, every: int = 1, scale: float = 1.0, rgb: bool = True, **options):
+        super().__init__(path, fps, every, scale, rgb)
+        import imageio
+        self._writer = imageio.get_writer(path, fps=fps, **options)
+
+    def _write(self, image: Image.Image):
+        self._writer.append_data(np.asarray(image))
+
+    def close(self):
+        self._writer.close()
+
+
+def open_writer(path, fps: float = 10, **options) -> FrameWriter:
+    # GifWriter para .gif, VideoWriter para o resto
+    if str(path).lower().endswith(".gif"):
+        return GifWriter(path, fps, **options)
+    return VideoWriter(path, fps, **options)
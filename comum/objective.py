@@ -0,0 +1,94 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+def is_batch(func) -> bool:
+    return getattr(func, "batch", False)
+
+
+class _Unpacked:
+    """
+    Adapta um objetivo de coordenadas separadas, func(x, y, z), ao
+    protocolo ponto a ponto func(ponto). É uma classe de módulo, não uma
+    lambda, para poder ir aos workers de um ProcessPoolEvaluator.
+    """
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, point: np.ndarray) -> float:
+        return self.func(*point)
+
+
+def evaluate(func, points: np.ndarray, unpack: bool = False, evaluator=None) -> np.ndarray:
+    """
+    Avalia os pontos (N, D). Objetivos em lote recebem a matriz numa
+    única chamada; os demais são chamados ponto a ponto, com o vetor
+    (unpack=False) ou com as coordenadas desempacotadas (unpack=True).
+    Com um evaluator (ver comum.evaluators) os pontos são enviados a ele,
+    respeitando unpack da mesma forma.
+    """
+    points = np.atleast_2d(points)
+    if unpack and not is_batch(func):
+        func = _Unpacked(func)
+    if evaluator is not None:
+        return np.asarray(evaluator.map(func, points), dtype=float)
+    if is_batch(func):
+        return np.asarray(func(points), dtype=float).reshape(len(points))
+    return np.array([func(p) for p in points], dtype=float)
+
+
+def evaluate_grid(func, *grids: np.ndarray) -> np.ndarray:
+    """
+    Avalia uma malha (como a do meshgrid das superfícies). Objetivos
+    elemento a elemento já aceitam as malhas diretamente.
+    """
+    if not is_batch(func):
+        return func(*grids)
+    points = np.column_stack([g.ravel() for g in grids])
+    return evaluate(func, points).reshape(grids[0].shape)
+
+
+class Separable(ABC):
+    """
+    Objetivo separável por dimensão, no protocolo em lote:
+
+        f(x) = combine(reduce_1(t_1(x_i, i)), ..., reduce_k(t_k(x_i, i)))
+
+    terms(values, dims) devolve as k contribuições (..., k) de cada
+    coordenada e reductions diz como cada uma é agregada ao longo das
+    dimensões ("sum" ou "prod"). Com isso o otimizador guarda as
+    contribuições de cada indivíduo e, quando só algumas coordenadas
+    mudam, recalcula os termos apenas nelas (ver DifferentialEvo).
+    """
+    batch = True
+    reductions = ()
+
+    @abstractmethod
+    def terms(self, values: np.ndarray, dims: np.ndarray) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def combine(self, aggregates: np.ndarray, num_dimensions: int) -> np.ndarray:
+        ...
+
+    def contributions(self, points: np.ndarray) -> np.ndarray:
+        # (N, D, k) com os termos de todas as coordenadas
+        return self.terms(points, np.arange(points.shape[-1]))
+
+    def aggregate(self, contributions: np.ndarray) -> np.ndarray:
+        # (..., D, k) -> (..., k), reduzindo cada termo ao longo das dimensões
+        return np.stack([
+            np.prod(contributions[..., j], axis=-1) if reduction == "prod"
+            else np.sum(contributions[..., j], axis=-1)
+            for j, reduction in enumerate(self.reductions)
+        ], axis=-1)
+
+    def __call__(self, points: np.ndarray):
+        contributions = self.contributions(np.asarray(points))
+        return self.combine(self.aggregate(contributions), contributions.shape[-2])
+
+
+def is_separable(func) -> bool:
+    return isinstance(func, Separable)
+
@@ -0,0 +1,136 @@
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+import numpy as np
+
+from comum.gif_writer import open_writer
+
+
+# Renderer do processo atual: montado uma vez por worker em _setup_worker
+_renderer = None
+
+MAX_CHUNK = 8  # quadros por bloco no máximo: cada quadro RGBA tem alguns MB
+
+
+def _setup_worker(renderer):
+    """
+    Inicializa o worker: backend sem janela e figura montada uma única
+    vez; os quadros do worker só atualizam os artistas com draw(i).
+    """
+    global _renderer
+    import matplotlib
+    matplotlib.use("Agg")
+    _renderer = renderer
+    _renderer.setup()
+
+
+def _capture(renderer, i: int) -> np.ndarray:
+    renderer.draw(i)
+    canvas = renderer.fig.canvas
+    if not getattr(renderer, "blit", False):  # BlitRenderer já deixa o quadro pronto no buffer
+        canvas.draw()
+    return np.array(canvas.buffer_rgba())  # cópia: o buffer é reaproveitado no próximo draw
+
+
+class BlitRenderer(ABC):
+    """
+    Base de renderers com fundo fixo: a parte estática da figura
+    (superfície, eixos 3D, títulos) é desenhada uma vez em setup() e
+    guardada; cada quadro restaura esse fundo e desenha por cima só os
+    artistas de self.animated, então o custo do quadro não depende do
+    que está no fundo (ex.: a resolução da superfície).
+
+    Subclasses implementam build(), que cria a figura e preenche
+    self.animated com artistas marcados com set_animated(True) (um eixo
+    inteiro pode ser animado, como o gráfico de fitness, cujos limites
+    mudam), e update(i), que só altera esses artistas.
+    """
+    blit = True
+
+    @abstractmethod
+    def build(self):
+        ...
+
+    @abstractmethod
+    def update(self, i: int):
+        ...
+
+    def setup(self):
+        self.animated = []
+        self.fig = self.build()
+        canvas = self.fig.canvas
+        canvas.draw()  # artistas animados ficam de fora do fundo
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+        return self.fig
+
+    def draw(self, i: int):
+        self.update(i)
+        self.fig.canvas.restore_region(self._background)
+        for artist in self.animated:
+            if hasattr(artist, "do_3d_projection"):
+                artist.do_3d_projection()  # coleções 3D projetam os pontos só no draw do Axes3D
+            self.fig.draw_artist(artist)
+
+
+def _render_chunk(frames) -> list:
+    # Blocos contíguos: quadros vizinhos costumam compartilhar estado (ex.: setas do PSO)
+    return [_capture(_renderer, i) for i in frames]
+
+
+def render_frames(renderer, frames, processes: int = None, chunksize: int = None):
+    """
+    Gera, em ordem, os quadros de um renderer com setup() e draw(i) (ver
+    SwarmRenderer, DERenderer e BlitRenderer); frames é o número de quadros ou a lista
+    de índices a desenhar. Os quadros são divididos em blocos e desenhados
+    num pool de processos, cada um com sua própria figura, e devolvidos na
+    ordem original; como só 2 * processes blocos ficam em andamento, a
+    memória não cresce com o número de quadros. Com processes=1 tudo roda
+    no processo atual.
+
+    O renderer é enviado aos workers antes de setup(), então deve guardar
+    apenas dados (registro, limites, objetivo), não artistas.
+    """
+    frames = range(frames) if isinstance(frames, int) else list(frames)
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(frames)) or 1
+    if processes == 1:
+        renderer.setup()
+        try:
+            for i in frames:
+                yield _capture(renderer, i)
+        finally:
+            import matplotlib.pyplot as plt
+            plt.close(renderer.fig)
+        return
+
+    # Blocos menores que len(frames)/processes equilibram workers com quadros mais lentos
+    chunksize = chunksize or min(MAX_CHUNK, max(1, len(frames) // (4 * processes)))
+    chunks = (frames[start:start + chunksize] for start in range(0, len(frames), chunksize))
+    with Pool(processes, initializer=_setup_worker, initargs=(renderer,)) as pool:
+        # No máximo 2 blocos por processo em andamento: se os workers forem
+        # mais rápidos que quem consome os quadros, eles esperam em vez de
+        # acumular quadros prontos na memória do processo principal
+        pending = deque(pool.apply_async(_render_chunk, (chunk,)) for chunk in islice(chunks, 2 * processes))
+        while pending:
+            done = pending.popleft().get()
+            for chunk in islice(chunks, 1):  # repõe o bloco antes de entregar os quadros
+                pending.append(pool.apply_async(_render_chunk, (chunk,)))
+            yield from done
+
+
+def render_gif(renderer, num_frames: int, gif_path, fps: int = 10, processes: int = None,
+               chunksize: int = None, every: int = 1, **writer_options):
+    """
+    Renderiza em paralelo e grava cada quadro no arquivo assim que chega,
+    na ordem (ver comum.gif_writer); writer_options (scale, colors,
+    palette, ...) vão para o escritor. every pula quadros já na
+    renderização e cada quadro gravado passa a durar every quadros, então
+    a animação mantém a duração total (fps é a taxa do registro inteiro).
+    """
+    with open_writer(gif_path, fps / every, **writer_options) as writer:
+        for frame in render_frames(renderer, range(0, num_frames, every), processes, chunksize):
+            writer.append(frame)
+    return writer.written
@@ -0,0 +1,101 @@
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+
+class StopReport(NamedTuple):
+    reason: str          # critério que disparou, ou "max_generations"
+    generations: int
+    evaluations: int
+    best_value: float
+    elapsed: float       # segundos desde start()
+
+
+def population_diameter(population) -> float:
+    """
+    Maior extensão da população entre os eixos (caixa envolvente), O(N·D).
+    """
+    return float(np.max(np.ptp(np.asarray(population, dtype=float), axis=0)))
+
+
+class StopCriteria:
+    """
+    Critérios de parada compartilhados por DE, PSO e AG. Cada critério é
+    desligado com None:
+
+    - target: para quando o melhor valor chega a epsilon do alvo (ex.: fmin);
+    - patience: para após patience gerações sem melhora maior que min_delta;
+    - min_diameter: para quando a população colapsa abaixo desse diâmetro;
+    - max_time: orçamento de tempo de parede, em segundos;
+    - max_evaluations: orçamento de avaliações do objetivo.
+    """
+    def __init__(self, target: float = None, epsilon: float = 0.0,
+                 patience: int = None, min_delta: float = 0.0,
+                 min_diameter: float = None, max_time: float = None,
+                 max_evaluations: int = None):
+        self.target = target
+        self.epsilon = epsilon
+        self.patience = patience
+        self.min_delta = min_delta
+        self.min_diameter = min_diameter
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.start()
+
+    def start(self, maximize: bool = False):
+        self.maximize = maximize
+        self.reason = None
+        self.generations = 0
+        self.evaluations = 0
+        self.best_value = None
+        self._stalled = 0
+        self._start_time = time.perf_counter()
+
+    def _improved(self, value: float) -> bool:
+        if self.best_value is None:
+            return True
+        if self.maximize:
+            return value > self.best_value + self.min_delta
+        return value < self.best_value - self.min_delta
+
+    def _target_reached(self, value: float) -> bool:
+        if self.maximize:
+            return value >= self.target - self.epsilon
+        return value <= self.target + self.epsilon
+
+    def check(self, best_value: float, population=None, evaluations: int = 0) -> str:
+        """
+        Registra uma geração e devolve o nome do critério que disparou,
+        ou None para continuar.
+        """
+        best_value = float(best_value)
+        self.generations += 1
+        self.evaluations = evaluations
+        if self._improved(best_value):
+            self.best_value = best_value
+            self._stalled = 0
+        else:
+            self._stalled += 1
+
+        if self.target is not None and self._target_reached(best_value):
+            self.reason = "target"
+        elif self.patience is not None and self._stalled >= self.patience:
+            self.reason = "stagnation"
+        elif (self.min_diameter is not None and population is not None
+              and population_diameter(population) < self.min_diameter):
+            self.reason = "diameter"
+        elif self.max_time is not None and time.perf_counter() - self._start_time >= self.max_time:
+            self.reason = "time"
+        elif self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            self.reason = "evaluations"
+        return self.reason
+
+    def report(self) -> StopReport:
+        return StopReport(
+            reason=self.reason or "max_generations",
+            generations=self.generations,
+            evaluations=self.evaluations,
+            best_value=self.best_value,
+            elapsed=time.perf_counter() - self._start_time
+        )
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class Trajectory:
+    """
+    Registro por geração de uma execução (DE ou PSO), feito sem nenhuma
+    renderização: posições, valores de cada indivíduo, melhor ponto e
+    melhor valor e, no PSO, velocidades. A animação é depois uma
+    repetição desse registro, então o mesmo quadro i sempre mostra o
+    mesmo estado, não importa quantas vezes seja desenhado.
+
+    dimensions guarda só as primeiras coordenadas (os gráficos usam 3) e
+    as coordenadas ficam em float32, o que mantém o registro compacto
+    mesmo para populações N-dimensionais.
+    """
+    FIELDS = ("positions", "fitness", "best_positions", "best_values", "velocities")
+
+    def __init__(self, dimensions: int = None, dtype=np.float32):
+        self.dimensions = dimensions
+        self.dtype = dtype
+        self.positions = []       # (N, d) por geração
+        self.fitness = []         # (N,) por geração
+        self.best_positions = []  # (d,) por geração
+        self.best_values = []     # escalar por geração
+        self.velocities = []      # (N, d) por geração, vazio quando não há velocidades
+
+    def _coordinates(self, points) -> np.ndarray:
+        points = np.asarray(points)
+        return np.array(points[..., :self.dimensions], dtype=self.dtype)  # cópia: o otimizador reescreve seus arrays
+
+    def append(self, positions, fitness, best_position, best_value, velocities=None):
+        self.positions.append(self._coordinates(positions))
+        self.fitness.append(np.array(fitness, dtype=float))
+        self.best_positions.append(self._coordinates(best_position))
+        self.best_values.append(float(best_value))
+        if velocities is not None:
+            self.velocities.append(self._coordinates(velocities))
+
+    def __len__(self) -> int:
+        return len(self.best_values)
+
+    def save(self, path):
+        # .npz com um array (G, ...) por campo; permite renderizar a mesma execução depois
+        np.savez_compressed(path, dimensions=-1 if self.dimensions is None else self.dimensions,
+                            **{field: np.asarray(getattr(self, field)) for field in self.FIELDS})
+
+    @classmethod
+    def load(cls, path) -> "Trajectory":
+        with np.load(path) as data:
+            dimensions = int(data["dimensions"])
+            trajectory = cls(None if dimensions < 0 else dimensions, data["positions"].dtype)
+            for field in cls.FIELDS:
+                setattr(trajectory, field, list(data[field]))
+        trajectory.best_values = [float(v) for v in trajectory.best_values]
+        return trajectory
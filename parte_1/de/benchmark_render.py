@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from de import DifferentialEvo
+from plot import DERenderer
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import griewank
+from comum.render import render_frames
+
+
+def time_render(renderer, num_frames: int, processes: int) -> float:
+    start = time.perf_counter()
+    for _ in render_frames(renderer, num_frames, processes):
+        pass  # só o desenho: sem gravar o GIF
+    return time.perf_counter() - start
+
+
+def main():
+    # Mede o render_frames em série e no pool; o ganho depende dos núcleos da máquina
+    np.random.seed(42)
+    NUM_GENERATIONS = 120
+    SPACE = 1000
+    cpus = os.cpu_count() or 1
+    process_counts = [int(arg) for arg in sys.argv[1:]] or sorted({1, 2, 4, 8, 16, 32, cpus})
+
+    space = {"x_min": -SPACE, "x_max": SPACE, "y_min": -SPACE, "y_max": SPACE, "resolution": 200}
+    de = DifferentialEvo(F=0.4, probability_recombination=0.5, fitness=griewank,
+                         upperBound=np.array([SPACE]*3), lowerBound=np.array([-SPACE]*3),
+                         num_individuals=30, num_dimensions=3, batch=True, maximize=False)
+    trajectory = de.record(NUM_GENERATIONS, dimensions=3)
+    xmin, ymin, zmin = griewank.optimum(3)
+    renderer = DERenderer(trajectory, "Griewank", xmin, ymin, zmin, griewank.fmin(3), space, (0, 400), 0.3,
+                          griewank, NUM_GENERATIONS)
+
+    print(f"{len(trajectory)} quadros do DE (Griewank), {cpus} núcleos disponíveis")
+    if cpus == 1:
+        print("Só 1 núcleo: os tempos com mais processos medem apenas o custo do pool, não o ganho")
+    print(f"{'Processos':>10} | {'Tempo (s)':>10} | {'Aceleração':>10}")
+    serial = None
+    for processes in process_counts:
+        elapsed = time_render(renderer, len(trajectory), processes)
+        serial = serial or elapsed
+        print(f"{processes:>10} | {elapsed:>10.2f} | {serial / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
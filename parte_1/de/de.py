@@ -1,5 +1,13 @@
+import os
+import sys
+
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.objective import evaluate, is_separable
+from comum.stopping import StopCriteria, StopReport
+from comum.trajectory import Trajectory
+
 
 class DifferentialEvo:
     def __init__(self,
@@ -9,7 +17,11 @@ class DifferentialEvo:
                  upperBound: np.ndarray,
                  lowerBound: np.ndarray,
                  num_individuals: int,
-                 num_dimensions: int
+                 num_dimensions: int,
+                 batch: bool = False,
+                 maximize: bool = True,
+                 evaluator=None,
+                 asynchronous: bool = False
                 ):
         
         self.F = F
@@ -19,32 +31,203 @@ class DifferentialEvo:
         self.lowerBound = lowerBound
         self.num_individuals = num_individuals
         self.num_dimensions = num_dimensions
+        self.batch = batch # gera toda a população de uma vez com operações (N, D)
+        self.maximize = maximize
+        self.evaluator = evaluator # backend de comum.evaluators; None avalia no próprio processo
+        # Modo sequencial: por padrão a geração é síncrona (todos os testes avaliados numa
+        # chamada, depois a seleção); asynchronous=True mantém o DE original, em que cada
+        # filho aceito substitui o pai na hora e já serve de doador no resto da geração
+        if asynchronous and batch:
+            raise ValueError("asynchronous só se aplica ao modo sequencial (batch=False)")
+        self.asynchronous = asynchronous
+        self.evaluations = 0 # chamadas acumuladas ao objetivo, por indivíduo
         self.pop = self._initialize_population()
+        self.fitness_values = self._evaluate(self.pop) # alinhado com self.pop
+
+        # Objetivos separáveis (comum.objective.Separable) no modo em lote:
+        # guarda as contribuições (N, D, k) de cada coordenada para só
+        # recalcular os termos das coordenadas vindas do doador
+        self.contributions = None
+        self.aggregates = None
+        if self.batch and is_separable(self.fitness) and self.evaluator is None:
+            self.contributions = self.fitness.contributions(self.pop)
+            self.aggregates = self.fitness.aggregate(self.contributions)
+
+    @property
+    def best_index(self) -> int:
+        if self.maximize:
+            return int(np.argmax(self.fitness_values))
+        return int(np.argmin(self.fitness_values))
+
+    @property
+    def best_value(self) -> float:
+        return float(self.fitness_values[self.best_index])
+
+    @property
+    def best_individual(self) -> np.ndarray:
+        return self.pop[self.best_index]
+
+    def replace_rows(self, rows: np.ndarray, individuals: np.ndarray, values: np.ndarray):
+        """
+        Troca os indivíduos das linhas rows (ex.: imigrantes no modelo de
+        ilhas) com seus valores já calculados, mantendo o cache de
+        contribuições coerente: sem isso os próximos testes dessas linhas
+        seriam pontuados pelos termos do indivíduo antigo.
+        """
+        self.pop[rows] = individuals
+        self.fitness_values[rows] = values
+        if self.contributions is not None:
+            self.contributions[rows] = self.fitness.contributions(self.pop[rows])
+            self.aggregates[rows] = self.fitness.aggregate(self.contributions[rows])
+
+    def run(self, max_generations: int, stop: StopCriteria = None) -> StopReport:
+        """
+        Executa até max_generations gerações ou até um critério de stop
+        disparar, e informa qual critério parou a execução.
+        """
+        stop = stop or StopCriteria()
+        stop.start(maximize=self.maximize)
+        for _ in range(max_generations):
+            self.optimize()
+            if stop.check(self.best_value, self.pop, self.evaluations):
+                break
+        return stop.report()
+
+    def record(self, max_generations: int, stop: StopCriteria = None, dimensions: int = None) -> Trajectory:
+        """
+        Como run, mas guarda população, valores e melhor indivíduo de
+        cada geração num Trajectory, para a animação ser só uma repetição.
+        """
+        trajectory = Trajectory(dimensions)
+        stop = stop or StopCriteria()
+        stop.start(maximize=self.maximize)
+        for _ in range(max_generations):
+            self.optimize()
+            trajectory.append(self.pop, self.fitness_values, self.best_individual, self.best_value)
+            if stop.check(self.best_value, self.pop, self.evaluations):
+                break
+        return trajectory
+
+    def optimize(self, maximize=None):
+        if maximize is not None:
+            self.maximize = maximize
+
+        if self.batch:
+            self._optimize_batch()
+            return
+        if self.asynchronous:
+            self._optimize_asynchronous()
+            return
 
-    def optimize(self, maximize=True):
-        best_individuals = self.pop
-        for parent in self.pop:
+        # Monta todos os testes antes de avaliar: a geração inteira vai
+        # numa única chamada, que o evaluator divide em blocos
+        trials = np.empty_like(self.pop)
+        for parent_index, parent in enumerate(self.pop):
             donor = self._mutation() # iterativamente constrói a população mutada
             offspring = self._crossover(parent, donor) # resultado do cruzamento é o melhor indivíduo
-            offspring = self.enforce_bounds(offspring)
-            
-            if maximize:
-                best = self._selection_maximize(parent, offspring)
-            else:
-                best = self._selection_minimize(parent, offspring)
-            
-            parent_index = np.where((self.pop == parent).all(axis=1))[0] # seleciona o index equivalente ao do pai
-            best_individuals[parent_index] = best # substitui no index equivalente ao do pai pelo melhor
-        
-        self.pop = best_individuals
+            trials[parent_index] = self.enforce_bounds(offspring)
+
+        # só os filhos são avaliados: os valores dos pais já estão em cache
+        trial_values = self._evaluate(trials)
+        improved = self._selection(self.fitness_values, trial_values)
+        self.pop[improved] = trials[improved] # substitui no index equivalente ao do pai
+        self.fitness_values[improved] = trial_values[improved]
+
+    def _optimize_asynchronous(self):
+        """
+        Geração do DE original: cada teste é avaliado e selecionado assim
+        que é criado, e o vencedor substitui o pai no lugar, então os
+        doadores seguintes já veem os indivíduos melhorados. Uma chamada
+        ao objetivo por teste, sem dividir a geração no evaluator.
+        """
+        for parent_index in range(self.num_individuals):
+            donor = self._mutation()
+            offspring = self.enforce_bounds(self._crossover(self.pop[parent_index], donor))
+            value = self._evaluate(offspring)[0]
+            if self._selection(self.fitness_values[parent_index], value):
+                self.pop[parent_index] = offspring
+                self.fitness_values[parent_index] = value
+
+    def _optimize_batch(self):
+        """
+        Uma geração inteira em operações vetorizadas: doadores, máscaras
+        de cruzamento, limites e seleção são calculados para a população
+        toda e os sobreviventes são escritos de volta por índice.
+        """
+        donors = self._mutation_batch()
+        trials, mask = self._crossover_batch(self.pop, donors)
+        trials = self.enforce_bounds(trials)
+
+        if self.contributions is not None:
+            trial_fitness, rows, dims, terms = self._evaluate_delta(trials, mask)
+        else:
+            trial_fitness = self._evaluate(trials)
+        improved = self._selection(self.fitness_values, trial_fitness)
+
+        self.pop[improved] = trials[improved]
+        self.fitness_values[improved] = trial_fitness[improved]
+        if self.contributions is not None:
+            accepted = improved[rows]
+            self.contributions[rows[accepted], dims[accepted]] = terms[accepted]
+            # reagrega as linhas aceitas a partir do cache, sem acumular erro de arredondamento
+            self.aggregates[improved] = self.fitness.aggregate(self.contributions[improved])
     
+    def _evaluate(self, points: np.ndarray) -> np.ndarray:
+        values = evaluate(self.fitness, points, evaluator=self.evaluator)
+        self.evaluations += len(values)
+        return values
+
+    def _evaluate_delta(self, trials: np.ndarray, mask: np.ndarray):
+        """
+        Reavalia os testes partindo do cache dos pais: os termos só são
+        calculados nas coordenadas da máscara de cruzamento (as demais
+        são iguais às do pai, já dentro dos limites). Somas são
+        atualizadas pela diferença dos termos trocados e produtos pela
+        razão novo/antigo dos fatores trocados, ambos em O(coordenadas
+        trocadas); só as linhas com um fator antigo nulo refazem o produto.
+        """
+        rows, dims = np.nonzero(mask)
+        terms = self.fitness.terms(trials[rows, dims], dims)
+        old_terms = self.contributions[rows, dims]
+
+        aggregates = self.aggregates.copy()
+        for j, reduction in enumerate(self.fitness.reductions):
+            if reduction == "prod":
+                self._update_products(aggregates[:, j], rows, dims, terms[:, j], old_terms[:, j], j)
+            else:
+                aggregates[:, j] += np.bincount(rows, terms[:, j] - old_terms[:, j], minlength=len(trials))
+
+        self.evaluations += len(trials)
+        return self.fitness.combine(aggregates, self.num_dimensions), rows, dims, terms
+
+    def _update_products(self, products: np.ndarray, rows: np.ndarray, dims: np.ndarray,
+                         new: np.ndarray, old: np.ndarray, j: int):
+        # rows vem de np.nonzero, então já está ordenado e reduceat multiplica por linha
+        nonzero = old != 0
+        ratios = np.divide(new, old, out=np.ones_like(new), where=nonzero)
+        changed, starts = np.unique(rows, return_index=True)
+        products[changed] *= np.multiply.reduceat(ratios, starts)
+
+        # Fator antigo nulo não tem razão: refaz o produto só dessas linhas
+        zero_rows = np.unique(rows[~nonzero])
+        if zero_rows.size:
+            factors = self.contributions[zero_rows, :, j].copy()
+            swapped = np.isin(rows, zero_rows)
+            factors[np.searchsorted(zero_rows, rows[swapped]), dims[swapped]] = new[swapped]
+            products[zero_rows] = np.prod(factors, axis=1)
+
     def enforce_bounds(self, offspring: np.ndarray):
-        for i in range(len(offspring)):
-            if offspring[i] < self.lowerBound[i]:
-                offspring[i] = 2 * self.lowerBound[i] - offspring[i]
-            elif offspring[i] > self.upperBound[i]:
-                offspring[i] = 2 * self.upperBound[i] - offspring[i]
-        return offspring
+        """
+        Reflete nos limites os genes que os ultrapassam. Aceita um
+        indivíduo (D,) ou uma população inteira (N, D). Com F > 1 um
+        gene pode passar do limite por mais que a largura do domínio e
+        continuar fora depois da reflexão: o corte final garante que
+        toda a população fica no domínio (o cache de contribuições
+        supõe que as coordenadas herdadas do pai já estão nos limites).
+        """
+        offspring = np.where(offspring < self.lowerBound, 2 * self.lowerBound - offspring, offspring)
+        offspring = np.where(offspring > self.upperBound, 2 * self.upperBound - offspring, offspring)
+        return np.clip(offspring, self.lowerBound, self.upperBound)
     
     def _initialize_population(self):
         rnd_distributed_individuals = np.random.rand(self.num_individuals, self.num_dimensions)
@@ -77,6 +260,26 @@ class DifferentialEvo:
         to_mutate = (individuals[0], individuals[1], individuals[2])
         return to_mutate
 
+    def _mutation_batch(self):
+        r1, r2, r3 = self._randomize_three_random_indexes()
+        return self.pop[r1] + self.F*(self.pop[r2] - self.pop[r3])
+
+    def _randomize_three_random_indexes(self):
+        """
+        Sorteia, para cada linha, três índices distintos em O(N): cada
+        sorteio usa um intervalo menor e é deslocado para pular os
+        índices já escolhidos.
+        """
+        n = self.pop.shape[0]
+        r1 = np.random.randint(0, n, n)
+        r2 = np.random.randint(0, n - 1, n)
+        r2 += r2 >= r1
+        low, high = np.minimum(r1, r2), np.maximum(r1, r2)
+        r3 = np.random.randint(0, n - 2, n)
+        r3 += r3 >= low
+        r3 += r3 >= high
+        return r1, r2, r3
+
     def _crossover(self, parent: np.ndarray, donor: np.ndarray):
         """
         Recombinação binomial usando gene_donor_percentage como p_r.
@@ -94,12 +297,30 @@ class DifferentialEvo:
         offspring[mask] = donor[mask]
         return offspring
 
-    def _selection_maximize(self, parent: np.ndarray, offspring: np.ndarray):
-        if self.fitness(offspring) > self.fitness(parent):
-            return offspring
-        return parent
+    def _crossover_batch(self, parents: np.ndarray, donors: np.ndarray):
+        """
+        Recombinação binomial de todas as linhas de uma vez.
+        """
+        n, d = parents.shape
+        mask = np.random.rand(n, d) < self.probability_recombination
+
+        # Garante pelo menos 1 gene do doador em cada linha
+        empty = ~mask.any(axis=1)
+        mask[empty, np.random.randint(0, d, empty.sum())] = True
+
+        return np.where(mask, donors, parents), mask
+
+    def _selection(self, parent_value, offspring_value):
+        """
+        Compara valores já calculados (escalares ou vetores alinhados) e
+        indica onde o filho substitui o pai.
+        """
+        if self.maximize:
+            return self._selection_maximize(parent_value, offspring_value)
+        return self._selection_minimize(parent_value, offspring_value)
+
+    def _selection_maximize(self, parent_value, offspring_value):
+        return offspring_value > parent_value
     
-    def _selection_minimize(self, parent, offspring):
-        if self.fitness(offspring) < self.fitness(parent):
-            return offspring
-        return parent
+    def _selection_minimize(self, parent_value, offspring_value):
+        return offspring_value < parent_value
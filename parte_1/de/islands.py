@@ -0,0 +1,131 @@
+import os
+import sys
+from multiprocessing import Pool
+from typing import NamedTuple
+
+import numpy as np
+
+from de import DifferentialEvo
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import schwefel
+
+
+class IslandResult(NamedTuple):
+    best_individual: np.ndarray
+    best_value: float
+    island: int               # ilha que encontrou o melhor
+    histories: np.ndarray     # (ilhas, gerações) com o melhor valor de cada ilha
+
+
+def _run_epoch(args):
+    """
+    Executa, num processo do pool, as gerações de uma ilha até a próxima
+    migração. A semente vem do processo principal, então a execução é
+    reprodutível independentemente de qual processo pega a ilha.
+    """
+    de, generations, seed = args
+    np.random.seed(seed)
+    history = []
+    for _ in range(generations):
+        de.optimize()
+        history.append(de.best_value)
+    return de, history
+
+
+def _ranked(de: DifferentialEvo) -> np.ndarray:
+    # Índices do melhor para o pior
+    order = np.argsort(de.fitness_values)
+    return order[::-1] if de.maximize else order
+
+
+def _migrate(islands: list, migrants: int, topology: str, rng: np.random.Generator):
+    """
+    Cada ilha envia cópias dos seus melhores indivíduos para a vizinha,
+    onde eles substituem os piores. No anel a vizinha é sempre a próxima;
+    na topologia aleatória o anel é embaralhado a cada migração.
+    """
+    order = np.arange(len(islands))
+    if topology == "random":
+        order = rng.permutation(len(islands))
+    elif topology != "ring":
+        raise ValueError(f"Topologia desconhecida: {topology}")
+
+    # Os emigrantes são escolhidos antes de qualquer substituição
+    outgoing = []
+    for de in islands:
+        best = _ranked(de)[:migrants]
+        outgoing.append((de.pop[best].copy(), de.fitness_values[best].copy()))
+
+    for position, source in enumerate(order):
+        target = islands[order[(position + 1) % len(order)]]
+        worst = _ranked(target)[::-1][:migrants]
+        target.replace_rows(worst, *outgoing[source])
+
+
+def run_islands(islands: list, generations: int, migration_interval: int, migrants: int,
+                topology: str = "ring", processes: int = None, seed: int = None) -> IslandResult:
+    """
+    Modelo de ilhas: cada DifferentialEvo evolui num processo separado e,
+    a cada migration_interval gerações, os melhores migrants indivíduos
+    de cada ilha migram pela topologia ("ring" ou "random").
+
+    O objetivo das ilhas precisa ser serializável com pickle.
+    """
+    rng = np.random.default_rng(seed)
+    histories = [[] for _ in islands]
+
+    with Pool(processes or min(len(islands), os.cpu_count())) as pool:
+        done = 0
+        while done < generations:
+            epoch = min(migration_interval, generations - done)
+            seeds = rng.integers(0, 2**32, len(islands))
+            results = pool.map(_run_epoch, [(de, epoch, s) for de, s in zip(islands, seeds)])
+
+            islands[:] = [de for de, _ in results]
+            for history, (_, epoch_history) in zip(histories, results):
+                history.extend(epoch_history)
+
+            done += epoch
+            if done < generations:
+                _migrate(islands, migrants, topology, rng)
+
+    bests = [de.best_value for de in islands]
+    winner = int(np.argmax(bests) if islands[0].maximize else np.argmin(bests))
+    return IslandResult(
+        best_individual=islands[winner].best_individual.copy(),
+        best_value=bests[winner],
+        island=winner,
+        histories=np.array(histories)
+    )
+
+
+def main():
+    np.random.seed(42)
+    NUM_ISLANDS = 8
+    DIMENSIONS = 30
+
+    lower, upper = schwefel.bounds(DIMENSIONS)
+    islands = [
+        DifferentialEvo(
+            F=0.8,
+            probability_recombination=0.5,
+            fitness=schwefel,
+            upperBound=upper,
+            lowerBound=lower,
+            num_individuals=40,
+            num_dimensions=DIMENSIONS,
+            batch=True,
+            maximize=False
+        )
+        for _ in range(NUM_ISLANDS)
+    ]
+
+    result = run_islands(islands, generations=2000, migration_interval=50, migrants=2,
+                         topology="ring", seed=42)
+    print(f"Melhor valor: {result.best_value:.4f} (ilha {result.island})")
+    print(f"Melhor por ilha: {np.round(result.histories[:, -1], 4)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,191 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.objective import evaluate, evaluate_grid
+from comum.render import BlitRenderer
+
+
+class SurfacePlot:
+    """
+    Superfície do objetivo e população num eixo 3D. A superfície, o mínimo
+    global e a configuração do eixo são criados uma única vez; update()
+    só move os pontos da população e recolore pelo fitness, sem refazer a
+    malha nem reavaliar o objetivo em resolution² pontos.
+    """
+    def __init__(self, title: str, pop: np.ndarray, xmin: float, ymin: float, zmin: float, fmin: float, space: dict, z_lim: tuple, alpha: float, ax: plt.Axes, obj, fitness: np.ndarray = None):
+        self.ax = ax
+        self.zmin = zmin
+        self.obj = obj
+
+        # ========== Visualização da Superfície 3D (z variável) ==========
+        x = np.linspace(space["x_min"], space["x_max"], space["resolution"])  # Resolução reduzida para performance
+        y = np.linspace(space["y_min"], space["y_max"], space["resolution"])
+        X, Y = np.meshgrid(x, y)
+
+        # Fixa z = zmin (mínimo global) para a superfície de referência
+        Z_surface = evaluate_grid(obj, X, Y, np.full_like(X, zmin))  # Superfície em z ótimo
+
+        self.surface = ax.plot_surface(X, Y, Z_surface, cmap='viridis', alpha=alpha)
+
+        # ========== Plot dos Indivíduos (x, y, z) com Cores Baseadas no Fitness ==========
+        self.scatter = ax.scatter(
+            pop[:, 0], pop[:, 1], pop[:, 2] - zmin,  # Coordenadas 3D reais
+            c=self._fitness(pop, fitness),  # Cores baseadas no fitness
+            cmap=plt.cm.plasma,
+            s=50,
+            edgecolor='black',
+            vmin=z_lim[0], vmax=z_lim[1]  # Normalização das cores
+        )
+
+        # ========== Mínimo Global 3D ==========
+        # PLOT DO PONTO MÍNIMO GLOBAL
+        ax.scatter(
+            xmin, ymin, fmin,
+            color="red", marker="*", s=200,
+            edgecolors="black", label="Mínimo Global"
+        )
+
+        # Configurações do gráfico
+        ax.set_title(title)
+        ax.set_xlim(space["x_min"], space["x_max"])
+        ax.set_ylim(space["y_min"], space["y_max"])
+        ax.set_zlim(z_lim[0], z_lim[1])
+        ax.set_xlabel("X")
+        ax.set_ylabel("Y")
+        ax.set_zlabel("Z")
+
+    def _fitness(self, pop: np.ndarray, fitness: np.ndarray = None) -> np.ndarray:
+        if fitness is None:  # o DE já guarda os valores da população; só reavalia se não vierem
+            fitness = evaluate(self.obj, pop, unpack=True)
+        return fitness
+
+    def update(self, pop: np.ndarray, fitness: np.ndarray = None):
+        self.scatter._offsets3d = (pop[:, 0], pop[:, 1], pop[:, 2] - self.zmin)
+        self.scatter.set_array(np.asarray(self._fitness(pop, fitness)))
+        return self.scatter
+
+
+def func_plot(title: str, pop: np.ndarray, xmin: float, ymin: float, zmin: float, fmin: float, space: dict, z_lim: tuple, alpha: float, ax: plt.Axes, obj, fitness: np.ndarray = None):
+    # Desenho avulso; animações devem criar um SurfacePlot e chamar update a cada geração
+    return SurfacePlot(title, pop, xmin, ymin, zmin, fmin, space, z_lim, alpha, ax, obj, fitness).ax
+
+
+class DERenderer(BlitRenderer):
+    """
+    Animação do DE a partir de um Trajectory: superfície e população à
+    esquerda (SurfacePlot), curva do melhor fitness à direita. build()
+    monta a figura uma vez e update(i) só move a população, o texto e a
+    curva (ver comum.render.BlitRenderer). Os drivers mudam apenas as
+    configurações:
+
+    - text: modelo do texto no gráfico 3D, formatado com generation, x,
+      y, z, fitness e fmin; text_style vai para o text2D;
+    - xscale e yscale do gráfico de fitness; yscale="auto" usa log
+      quando o histórico varia mais que AUTO_LOG_RANGE e linear antes;
+    - colorbar e show_best acrescentam a barra de cores da superfície e
+      a estrela do melhor indivíduo.
+    """
+    AUTO_LOG_RANGE = 100
+    TEXT = ("Geração: {generation}\nMelhor Solução:\nX: {x:.2f}\nY: {y:.2f}\nZ: {z:.2f}\n"
+            "Fitness: {fitness:.2f}")
+
+    def __init__(self, trajectory, title: str, xmin: float, ymin: float, zmin: float, fmin: float, space: dict,
+                 z_lim: tuple, alpha: float, obj, num_generations: int = None, figsize: tuple = (20, 7),
+                 text: str = TEXT, text_style: dict = None, xscale: str = "linear", yscale: str = "log",
+                 colorbar: bool = False, show_best: bool = False, pad: float = 1.08):
+        self.trajectory = trajectory
+        self.title = title
+        self.xmin, self.ymin, self.zmin, self.fmin = xmin, ymin, zmin, fmin
+        self.space = space
+        self.z_lim = z_lim
+        self.alpha = alpha
+        self.obj = obj
+        self.num_generations = num_generations or len(trajectory)  # limite do eixo x do gráfico de fitness
+        self.figsize = figsize
+        self.text_template = text
+        self.text_style = text_style or {"fontsize": 10}
+        self.xscale = xscale
+        self.yscale = yscale
+        self.colorbar = colorbar
+        self.show_best = show_best
+        self.pad = pad
+        self.best_values = np.asarray(trajectory.best_values)
+
+    def build(self):
+        fig = plt.figure(figsize=self.figsize)
+
+        # Dois subplots: esquerda para 3D, direita para fitness
+        self.ax1 = fig.add_subplot(121, projection='3d')
+        self.ax2 = fig.add_subplot(122)
+        ax1, ax2, trajectory = self.ax1, self.ax2, self.trajectory
+
+        # Função 3D desenhada uma vez; a população é atualizada em update
+        self.surface = SurfacePlot(self.title, trajectory.positions[0], self.xmin, self.ymin, self.zmin, self.fmin,
+                                   self.space, self.z_lim, self.alpha, ax1, self.obj, trajectory.fitness[0])
+        animated = [self.surface.scatter]
+        if self.colorbar:
+            fig.colorbar(self.surface.surface, ax=ax1, shrink=0.5, aspect=5, label='Valor da função')
+        self.best = None
+        if self.show_best:
+            best = trajectory.best_positions[0]
+            self.best = ax1.scatter([best[0]], [best[1]], [best[2] - self.zmin],
+                                    c='red', marker='*', s=200, label='Melhor Indivíduo')
+            animated.append(self.best)
+            ax1.legend()
+        self.text = ax1.text2D(0.02, 0.95, "", transform=ax1.transAxes, **self.text_style)
+        animated.append(self.text)
+
+        # Gráfico de fitness
+        self.line, = ax2.plot([], [], 'b-', linewidth=2, label='Melhor Fitness')
+        self.point = ax2.scatter([0], [self.best_values[0]], color='red', s=50, zorder=5)  # geração atual
+        self.current_yscale = None  # escala em uso, escolhida em update
+        ax2.set_xscale(self.xscale)
+        ax2.set_xlabel('Geração')
+        ax2.set_title('Evolução do Fitness')
+        ax2.grid(True, which="both", linestyle='--', alpha=0.7)
+        ax2.legend()
+        ax2.set_xlim([0, self.num_generations])
+
+        self.update(0)  # layout calculado já com o texto e a curva preenchidos
+        fig.tight_layout(pad=self.pad)
+
+        # O eixo de fitness muda de limites e escala e é redesenhado inteiro
+        for artist in animated + [ax2]:
+            artist.set_animated(True)
+            self.animated.append(artist)
+        return fig
+
+    def _set_yscale(self, history: np.ndarray):
+        yscale = self.yscale
+        if yscale == "auto":  # linear enquanto a variação for pequena
+            yscale = 'log' if history.max() - history.min() > self.AUTO_LOG_RANGE else 'linear'
+        if yscale == self.current_yscale:
+            return  # trocar a escala refaz os localizadores; só quando muda
+        self.current_yscale = yscale
+        self.ax2.set_yscale(yscale)
+        self.ax2.set_ylabel('Melhor Fitness (log)' if yscale == 'log' else 'Melhor Fitness')
+
+    def update(self, generation):
+        trajectory = self.trajectory
+        best_solution = trajectory.best_positions[generation]
+        best_value = trajectory.best_values[generation]
+        history = self.best_values[:generation + 1]
+
+        # População e melhor indivíduo
+        self.surface.update(trajectory.positions[generation], trajectory.fitness[generation])
+        if self.best is not None:
+            self.best._offsets3d = ([best_solution[0]], [best_solution[1]], [best_solution[2] - self.zmin])
+        self.text.set_text(self.text_template.format(
+            generation=generation, x=best_solution[0], y=best_solution[1], z=best_solution[2],
+            fitness=best_value, fmin=self.fmin))
 
-def func_plot(title: str, pop: np.ndarray, xmin: float, ymin: float, zmin: float, fmin: float, space: dict, z_lim: tuple, alpha: float, ax: plt.Axes, obj):
-    # ========== Visualização da Superfície 3D (z variável) ==========
-    x = np.linspace(space["x_min"], space["x_max"], space["resolution"])  # Resolução reduzida para performance
-    y = np.linspace(space["y_min"], space["y_max"], space["resolution"])
-    X, Y = np.meshgrid(x, y)
-    
-    # Fixa z = zmin (mínimo global) para a superfície de referência
-    Z_surface = obj(X, Y, np.full_like(X, zmin))  # Superfície em z ótimo
-    
-    ax.plot_surface(X, Y, Z_surface, cmap='viridis', alpha=alpha)
-
-    # ========== Plot dos Indivíduos (x, y, z) com Cores Baseadas no Fitness ==========
-    fitness = np.array([obj(*ind) for ind in pop])
-    ax.scatter(
-        pop[:, 0], pop[:, 1], pop[:, 2] - zmin,  # Coordenadas 3D reais
-        c=fitness,  # Cores baseadas no fitness
-        cmap=plt.cm.plasma,
-        s=50,
-        edgecolor='black',
-        vmin=z_lim[0], vmax=z_lim[1]  # Normalização das cores
-    )
-
-    # ========== Mínimo Global 3D ==========
-    # PLOT DO PONTO MÍNIMO GLOBAL
-    ax.scatter(
-        xmin, ymin, fmin,
-        color="red", marker="*", s=200,
-        edgecolors="black", label="Mínimo Global"
-    )
-
-    # Configurações do gráfico
-    ax.set_title(title)
-    ax.set_xlim(space["x_min"], space["x_max"])
-    ax.set_ylim(space["y_min"], space["y_max"])
-    ax.set_zlim(z_lim[0], z_lim[1])
-    ax.set_xlabel("X")
-    ax.set_ylabel("Y")
-    ax.set_zlabel("Z")
-    return ax
\ No newline at end of file
+        # Curva de fitness e ponto atual
+        self.line.set_data(range(generation + 1), history)
+        self.point.set_offsets([[generation, best_value]])
+        self._set_yscale(history)
+        self.ax2.relim()
+        self.ax2.autoscale_view(scalex=False)
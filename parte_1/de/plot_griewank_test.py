@@ -1,16 +1,14 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
 from de import DifferentialEvo
 from plot_test import plot_de
 
-
-def griewank(x, y, z):
-        sum_part = (x**2 + y**2 + z**2) / 4000
-        prod_part = (np.cos(x/np.sqrt(1)) * 
-                     np.cos(y/np.sqrt(2)) * 
-                     np.cos(z/np.sqrt(3)))
-        return sum_part - prod_part + 1
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import griewank
 
 
 def main():
@@ -31,19 +29,20 @@ def main():
              "resolution": 200
             }
     
-    xmin = 0
-    ymin = 0
-    zmin = 0
-    fmin = griewank(xmin, ymin, zmin) # valor mínimo conhecido
+    xmin, ymin, zmin = griewank.optimum(3)
+    fmin = griewank.fmin(3) # valor mínimo conhecido
     
+    objective = griewank  # objetivo em lote: avalia a população inteira numa chamada
+
     de = DifferentialEvo(
         F=0.4,
         probability_recombination=0.5,
-        fitness=lambda ind: griewank(*ind),
+        fitness=objective,
         upperBound=np.array([SPACE]*3),
         lowerBound=np.array([-SPACE]*3),
         num_individuals=POP_SIZE,
-        num_dimensions=DIMENSIONS
+        num_dimensions=DIMENSIONS,
+        maximize=False
     )
 
     plot_de(title="Griewank PSO",
@@ -56,7 +55,7 @@ def main():
             space=space,
             z_lim=(0, 400),
             alpha=alpha,
-            obj=griewank,
+            obj=objective,
             gif_path=gif_path)
 
 if __name__ == "__main__":
@@ -1,15 +1,14 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
 from de import DifferentialEvo
 from plot_test import plot_de
 
-
-def schwefel(x, y, z):
-    x_sin = x * np.sin(np.sqrt(np.abs(x)))
-    y_sin = y * np.sin(np.sqrt(np.abs(y)))
-    z_sin = z * np.sin(np.sqrt(np.abs(z)))
-    return (418.9829 * 3) - (x_sin + y_sin + z_sin)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import schwefel
 
 
 def main():
@@ -30,19 +29,20 @@ def main():
              "resolution": 400
             }
     
-    xmin = 420.9687
-    ymin = 420.9687
-    zmin = 420.9687
-    fmin = schwefel(xmin, ymin, zmin) # valor mínimo conhecido
+    xmin, ymin, zmin = schwefel.optimum(3)
+    fmin = schwefel.fmin(3) # valor mínimo conhecido
     
+    objective = schwefel  # objetivo em lote: avalia a população inteira numa chamada
+
     de = DifferentialEvo(
         F=0.8,
         probability_recombination=0.5,
-        fitness=lambda ind: schwefel(*ind),
+        fitness=objective,
         upperBound=np.array([SPACE]*3),
         lowerBound=np.array([-SPACE]*3),
         num_individuals=POP_SIZE,
-        num_dimensions=DIMENSIONS
+        num_dimensions=DIMENSIONS,
+        maximize=False
     )
 
     plot_de(title="Schwefel PSO",
@@ -55,7 +55,7 @@ def main():
             space=space,
             z_lim=(0, 1300),
             alpha=alpha,
-            obj=schwefel,
+            obj=objective,
             gif_path=gif_path)
 
 if __name__ == "__main__":
@@ -1,24 +1,23 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-# Função de griewank
-def griewank(x, y, z):
-        sum_part = (x**2 + y**2 + z**2) / 4000
-        prod_part = (np.cos(x/np.sqrt(1)) * 
-                     np.cos(y/np.sqrt(2)) * 
-                     np.cos(z/np.sqrt(3)))
-        return sum_part - prod_part + 1
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+from comum.benchmarks import griewank
+from comum.objective import evaluate_grid
 
 # Definir limites do gráfico
 x = np.linspace(-1000, 1000, 100)
 y = np.linspace(-1000, 1000, 100)
 X, Y = np.meshgrid(x, y)
-Z = griewank(X, Y, np.full_like(X, 0))
+Z = evaluate_grid(griewank, X, Y, np.full_like(X, 0))
 
 # Ponto mínimo global
-xmin, ymin, zmin = 0, 0, 0
-f_min = griewank(xmin, ymin, zmin)
+xmin, ymin, zmin = griewank.optimum(3)
+f_min = griewank.fmin(3)
 
 # Criar a figura e o eixo 3D
 fig = plt.figure(figsize=(10, 7))
@@ -1,20 +1,23 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
-# Função de Schwefel
-def schwefel(x, y):
-    return 418.9829 * 2 - (x * np.sin(np.sqrt(abs(x))) + y * np.sin(np.sqrt(abs(y))))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", ".."))
+from comum.benchmarks import schwefel
+from comum.objective import evaluate_grid
 
 # Definir limites do gráfico
 x = np.linspace(-500, 500, 400)
 y = np.linspace(-500, 500, 400)
 X, Y = np.meshgrid(x, y)
-Z = schwefel(X, Y)
+Z = evaluate_grid(schwefel, X, Y)
 
 # Ponto mínimo global
-xmin, ymin = 420.9687, 420.9687
-f_min = schwefel(xmin, ymin)
+xmin, ymin = schwefel.optimum(2)
+f_min = schwefel.fmin(2)
 
 # Criar a figura e o eixo 3D
 fig = plt.figure(figsize=(10, 7))
@@ -0,0 +1,36 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from swarm import Swarm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import griewank
+
+
+def time_per_iteration(num_dimensions: int, num_particles: int, iterations: int) -> float:
+    bounds = np.array([1000.0]*num_dimensions), np.array([-1000.0]*num_dimensions)
+    swarm = Swarm(griewank, num_particles, 0.8, 0.1, 0.1, bounds[0], bounds[1])
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        swarm.optimize()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    np.random.seed(42)
+    NUM_PARTICLES = 200
+    ITERATIONS = 50
+
+    print(f"PSO com {NUM_PARTICLES} partículas, média de {ITERATIONS} iterações")
+    print(f"{'Dimensões':>10} | {'ms/iteração':>12}")
+    for dimensions in (3, 30, 100, 1000):
+        elapsed = time_per_iteration(dimensions, NUM_PARTICLES, ITERATIONS)
+        print(f"{dimensions:>10} | {elapsed * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,54 +2,55 @@ import numpy as np
 
 
 class Particle:
-    def __init__(self, position: np.ndarray, velocity: np.ndarray):
-        self._position = position
-        self._velocity = velocity
-        self._best_position = position.copy()
-        self._best_value = float('inf')
+    """
+    Visão de uma partícula do enxame, mantida por compatibilidade: lê e
+    escreve diretamente a linha correspondente nos arrays do Swarm.
+    """
+    def __init__(self, swarm, index: int):
+        self._swarm = swarm
+        self._index = index
     
     def update_velocity(self, w: float, c1: float, c2: float, global_position: np.ndarray):
         r1, r2 = np.random.rand(2)
-        cognitive = c1 * r1 * (self._best_position - self._position)
-        social = c2 * r2 * (global_position - self._position)
-        self._velocity = w * self._velocity + cognitive + social
+        cognitive = c1 * r1 * (self.best_position - self.position)
+        social = c2 * r2 * (global_position - self.position)
+        self.velocity = w * self.velocity + cognitive + social
     
     def update_position(self, bounds):
-        self._position = self._position + self._velocity
         # Confinamento dentro dos limites
-        self._position = np.clip(self._position, bounds[1], bounds[0])
+        self.position = np.clip(self.position + self.velocity, bounds[1], bounds[0])
     
     @property
     def position(self):
-        return self._position
+        return self._swarm.positions[self._index]
     
     @position.setter
     def position(self, value):
-        self._position = value
+        self._swarm.positions[self._index] = value
     
     @property
     def velocity(self):
-        return self._velocity
+        return self._swarm.velocities[self._index]
     
     @velocity.setter
     def velocity(self, value):
-        self._velocity = value
+        self._swarm.velocities[self._index] = value
     
     @property
     def best_position(self):
-        return self._best_position
+        return self._swarm.best_positions[self._index]
     
     @best_position.setter
     def best_position(self, value):
-        self._best_position = value
+        self._swarm.best_positions[self._index] = value
     
     @property
     def best_value(self):
-        return self._best_value
+        return self._swarm.best_values[self._index]
     
     @best_value.setter
     def best_value(self, value):
-        self._best_value = value
+        self._swarm.best_values[self._index] = value
     
     def __str__(self):
-        return f"Position: {self._position} - Velocity: {self._velocity}"
\ No newline at end of file
+        return f"Position: {self.position} - Velocity: {self.velocity}"
@@ -1,149 +1,194 @@
-import imageio
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from swarm import Swarm
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.objective import evaluate_grid
+from comum.render import render_gif
+from comum.trajectory import Trajectory
+
+
+def arrow_segments(tails: np.ndarray, directions: np.ndarray, length: float,
+                   head_ratio: float = 0.3, head_angle: float = 15.0) -> np.ndarray:
+    """
+    Segmentos (3n, 2, 3) de n setas 3D com a mesma geometria do
+    ax.quiver (pivot na cauda, duas linhas de ponta girando a direção em
+    ±head_angle graus): n hastes seguidas de 2n linhas de ponta, prontos
+    para um único Line3DCollection.set_segments.
+    """
+    tails = np.asarray(tails, dtype=float)
+    directions = np.asarray(directions, dtype=float)
+    tips = tails + length * directions
+
+    # Eixo de rotação perpendicular à direção no plano xy (y quando a seta é vertical)
+    horizontal = np.linalg.norm(directions[:, :2], axis=1)
+    axis = np.zeros_like(directions)
+    np.divide(directions[:, 1], horizontal, out=axis[:, 0], where=horizontal != 0)
+    np.divide(-directions[:, 0], horizontal, out=axis[:, 1], where=horizontal != 0)
+    axis[horizontal == 0, 1] = 1.0
+
+    # Rodrigues com eixo perpendicular à direção: u cos(a) ± (k × u) sin(a)
+    angle = np.radians(head_angle)
+    along = np.cos(angle) * directions
+    across = np.sin(angle) * np.cross(axis, directions)
+    head = head_ratio * length
+    heads = np.concatenate([tips - head * (along + across), tips - head * (along - across)])
+
+    starts = np.concatenate([tips, tips, tips])  # hastes da ponta para a cauda, como no quiver
+    ends = np.concatenate([tails, heads])
+    return np.stack([starts, ends], axis=1)
+
+
+class SwarmRenderer:
+    """
+    Desenha um Trajectory do PSO: setup() monta a figura e os artistas,
+    draw(i) mostra a iteração i. draw depende só de i e do registro, então
+    pode ser chamado em qualquer ordem e repetido sem mudar o resultado.
+
+    As setas de velocidade são um único Line3DCollection cujos segmentos
+    são trocados a cada quiver_interval iterações (0 desliga as setas);
+    com mais de max_arrows partículas só uma a cada ceil(n / max_arrows)
+    ganha seta, sempre as mesmas, para enxames grandes continuarem legíveis
+    (max_arrows=None desenha todas).
+    """
+    QUIVER_INTERVAL = 5  # iterações entre atualizações das setas de velocidade
+    MAX_ARROWS = 500     # setas desenhadas no máximo por quadro
+
+    def __init__(self, trajectory: Trajectory, title: str, xmin: float, ymin: float, zmin: float, fmin: float,
+                 space: dict, z_lim: tuple, alpha: float, obj, iterations: int = None,
+                 quiver_interval: int = QUIVER_INTERVAL, max_arrows: int = MAX_ARROWS):
+        self.trajectory = trajectory
+        self.title = title
+        self.xmin, self.ymin, self.zmin, self.fmin = xmin, ymin, zmin, fmin
+        self.space = space
+        self.z_lim = z_lim
+        self.alpha = alpha
+        self.obj = obj
+        self.iterations = iterations or len(trajectory)  # limite do eixo x do gráfico de fitness
+        self.best_values = np.asarray(trajectory.best_values)
+        self.quiver_interval = quiver_interval
+        self.max_arrows = max_arrows
+
+    def setup(self):
+        # Criar figura com dois subplots
+        self.fig = plt.figure(figsize=(20, 8))
+        self.ax1 = self.fig.add_subplot(121, projection='3d')  # Visualização 3D
+        self.ax2 = self.fig.add_subplot(122)                  # Gráfico de fitness
+        ax1, ax2, space = self.ax1, self.ax2, self.space
+
+        # Configuração do gráfico de fitness
+        ax2.set_xlabel('Iteração')
+        ax2.set_ylabel('Melhor Fitness')
+        ax2.set_title('Evolução do Fitness')
+        ax2.grid(True)
+        ax2.set_yscale('log')
+
+        # Preparação da visualização 3D
+        x = np.linspace(space["x_min"], space["x_max"], space["resolution"])  # Resolução reduzida para performance
+        y = np.linspace(space["y_min"], space["y_max"], space["resolution"])
+        X, Y = np.meshgrid(x, y)
+        Z_surface = evaluate_grid(self.obj, X, Y, np.full_like(X, self.zmin))  # Superfície em z ótimo
+        surf = ax1.plot_surface(X, Y, Z_surface, cmap='viridis', alpha=self.alpha, edgecolor='none')
+
+        self.fig.colorbar(surf, ax=ax1, shrink=0.5, aspect=5, label='Valor da função')
 
+        # Elementos gráficos iniciais
+        # O gráfico 3D mostra as três primeiras coordenadas de enxames N-dimensionais
+        pos, gbest = self.trajectory.positions[0], self.trajectory.best_positions[0]
+        self.scatter_particles = ax1.scatter(pos[:, 0], pos[:, 1], np.clip(pos[:, 2], 0, space["resolution"]),
+                                             c='blue', marker='o', alpha=0.7, label='Partículas')
+        self.scatter_gbest = ax1.scatter([gbest[0]], [gbest[1]], [np.clip(gbest[2], 0, space["resolution"])],
+                                         c='red', marker='*', s=200, label='Melhor Global')
+        ax1.scatter([self.xmin], [self.ymin], [self.fmin],
+                    c='black', marker='X', s=200, label='Mínimo Global')
+        ax1.legend()
+
+        ax1.set_xlim([space["x_min"], space["x_max"]])
+        ax1.set_ylim([space['y_min'], space["y_max"]])
+        ax1.set_zlim(self.z_lim[0], self.z_lim[1])
+        ax1.set_xlabel('Eixo X')
+        ax1.set_ylabel('Eixo Y')
+        ax1.set_zlabel('Eixo Z')
+
+        # Linha de fitness inicial
+        self.line, = ax2.plot([], [], 'b-', lw=2, label='Melhor Fitness')
+        self.current_point, = ax2.plot([], [], 'ro', label='Atual')
+        ax2.legend()
+        ax2.set_xlim(0, self.iterations)
+
+        # Texto informativo
+        self.text = ax1.text2D(0.02, 0.95, self.title, transform=ax1.transAxes)
+
+        # Setas de velocidade: uma coleção só, atualizada em draw
+        num_particles = len(pos)
+        stride = -(-num_particles // self.max_arrows) if self.max_arrows else 1
+        self.arrows = slice(None, None, max(1, stride))  # partículas que ganham seta
+        self.quiver = Line3DCollection([], colors='blue', alpha=0.5)
+        ax1.add_collection3d(self.quiver, autolim=False)
+        self.quiver_frame = None  # iteração cujas velocidades as setas mostram
+        return self.fig
+
+    def draw(self, i: int):
+        space = self.space
+        pos = self.trajectory.positions[i]
+        gbest = self.trajectory.best_positions[i]
 
-def plot_swarm(title: str, swarm: Swarm, iterations: int, xmin: float, ymin: float, zmin: float, fmin: float, space: dict, z_lim: tuple, alpha: float, obj, gif_path):    
-    # Criar figura com dois subplots
-    fig = plt.figure(figsize=(20, 8))
-    ax1 = fig.add_subplot(121, projection='3d')  # Visualização 3D
-    ax2 = fig.add_subplot(122)                  # Gráfico de fitness
-    
-    # Configuração do gráfico de fitness
-    ax2.set_xlabel('Iteração')
-    ax2.set_ylabel('Melhor Fitness')
-    ax2.set_title('Evolução do Fitness')
-    ax2.grid(True)
-    ax2.set_yscale('log')
-    
-    # Histórico de fitness
-    best_fitness_history = []
-
-    # Preparação da visualização 3D
-    x = np.linspace(space["x_min"], space["x_max"], space["resolution"])  # Resolução reduzida para performance
-    y = np.linspace(space["y_min"], space["y_max"], space["resolution"])
-    X, Y = np.meshgrid(x, y)
-    Z_surface = obj(X, Y, np.full_like(X, zmin))  # Superfície em z ótimo
-    surf = ax1.plot_surface(X, Y, Z_surface, cmap='viridis', alpha=alpha, edgecolor='none')
-
-    fig.colorbar(surf, ax=ax1, shrink=0.5, aspect=5, label='Valor da função')
-    
-    # Elementos gráficos iniciais
-    pos, vel, best_pos, gbest = swarm.get_swarm_status()
-    scatter_particles = ax1.scatter(pos[0], pos[1], np.clip(pos[2], 0, space["resolution"]), 
-                                  c='blue', marker='o', alpha=0.7, label='Partículas')
-    scatter_gbest = ax1.scatter(gbest[0], gbest[1], np.clip(gbest[2], 0, space["resolution"]), 
-                              c='red', marker='*', s=200, label='Melhor Global')
-    scatter_min_global = ax1.scatter([xmin], [ymin], [fmin], 
-                            c='black', marker='X', s=200, label='Mínimo Global')
-    ax1.legend()
-    
-
-    ax1.set_xlim([space["x_min"], space["x_max"]])
-    ax1.set_ylim([space['y_min'], space["y_max"]])
-    ax1.set_zlim(z_lim[0], z_lim[1])
-    ax1.set_xlabel('Eixo X')
-    ax1.set_ylabel('Eixo Y')
-    ax1.set_zlabel('Eixo Z')
-    
-    # Linha de fitness inicial
-    line, = ax2.plot([], [], 'b-', lw=2, label='Melhor Fitness')
-    current_point, = ax2.plot([], [], 'ro', label='Atual')
-    ax2.legend()
-    ax2.set_xlim(0, iterations)
-    
-    # Texto informativo
-    text = ax1.text2D(0.02, 0.95, title, transform=ax1.transAxes)
-
-    def init():
-        line.set_data([], [])
-        current_point.set_data([], [])
-        text.set_text("")
-        return [scatter_particles, scatter_gbest, line, current_point, text]
-
-    def animate(i):
-        swarm.optimize()
-        pos, vel, best_pos, gbest = swarm.get_swarm_status()
-        
         # Aplica o limite em Z para todas as posições
-        clipped_pos_z = np.clip(pos[2], 0, space['resolution'])
+        clipped_pos_z = np.clip(pos[:, 2], 0, space['resolution'])
         clipped_gbest_z = np.clip(gbest[2], 0, space['resolution'])
-        
+
         # Atualiza visualização 3D com valores limitados
-        scatter_particles._offsets3d = (pos[0], pos[1], clipped_pos_z)
-        scatter_gbest._offsets3d = (gbest[0], gbest[1], clipped_gbest_z)
-        
-        # Atualiza histórico
-        current_fitness = float(swarm.best_global_value)
-        best_fitness_history.append(current_fitness)
-        
-        # Atualiza gráfico de fitness
-        iterations = range(len(best_fitness_history))
-        line.set_data(iterations, best_fitness_history)
-        current_point.set_data([i], [current_fitness])
-        
+        self.scatter_particles._offsets3d = (pos[:, 0], pos[:, 1], clipped_pos_z)
+        self.scatter_gbest._offsets3d = ([gbest[0]], [gbest[1]], [clipped_gbest_z])
+
+        # Atualiza gráfico de fitness com o histórico até i
+        history = self.best_values[:i + 1]
+        current_fitness = history[-1]
+        self.line.set_data(range(len(history)), history)
+        self.current_point.set_data([i], [current_fitness])
+
         # Ajusta limites do eixo y
-        current_min = min(best_fitness_history)
-        current_max = max(best_fitness_history)
-        ax2.set_ylim(current_min*0.9, current_max*1.1)
-        
+        self.ax2.set_ylim(history.min()*0.9, history.max()*1.1)
+
         # Atualiza texto
-        text.set_text(
+        self.text.set_text(
             f"Iteração: {i}\n"
-            f"Melhor Posição: [{float(gbest[0]):.2f}, {float(gbest[1]):.2f}, {float(gbest[2]):.2f}]\n"
+            f"Melhor Posição: [{gbest[0]:.2f}, {gbest[1]:.2f}, {gbest[2]:.2f}]\n"
             f"Melhor Fitness: {current_fitness:.4f}\n"
-            f"Mínimo Global: {fmin:.4f}"
+            f"Mínimo Global: {self.fmin:.4f}"
         )
-        
-        # Atualiza quivers a cada 5 iterações (com Z limitado)
-        if i % 5 == 0:
-            if hasattr(animate, 'quivers'):
-                for q in animate.quivers:
-                    q.remove()
-            vel_norm = np.linalg.norm(vel, axis=0)
-            vel_normalized = vel / (vel_norm + 1e-10)
-            animate.quivers = [ax1.quiver(pos[0,j], pos[1,j], np.clip(pos[2,j], 0, space["resolution"]),
-                              vel_normalized[0,j], vel_normalized[1,j], vel_normalized[2,j],
-                              length=space["x_max"]*0.02, color='blue', alpha=0.5)
-                             for j in range(swarm.num_particles)]
-        
-        artists = [scatter_particles, scatter_gbest, line, current_point, text]
-        if hasattr(animate, 'quivers'):
-            artists.extend(animate.quivers)
-        return artists
-
-    # Inicializa quivers
-    animate.quivers = []
-    
-    # Cria animação
-    anim = FuncAnimation(fig, animate, frames=iterations, 
-                        init_func=init, interval=300, blit=False)
-    
-    # Salvar GIF
+
+        # Setas da última iteração múltipla de quiver_interval (com Z limitado)
+        if self.quiver_interval and self.trajectory.velocities:
+            quiver_frame = i - i % self.quiver_interval
+            if quiver_frame != self.quiver_frame:
+                qpos = self.trajectory.positions[quiver_frame][self.arrows, :3]
+                vel = self.trajectory.velocities[quiver_frame][self.arrows, :3]
+                vel_norm = np.linalg.norm(vel, axis=1, keepdims=True)
+                vel_normalized = vel / (vel_norm + 1e-10)
+                tails = np.column_stack([qpos[:, 0], qpos[:, 1], np.clip(qpos[:, 2], 0, space["resolution"])])
+                self.quiver.set_segments(arrow_segments(tails, vel_normalized, space["x_max"]*0.02))
+                self.quiver_frame = quiver_frame
+
+        return [self.scatter_particles, self.scatter_gbest, self.line, self.current_point, self.text, self.quiver]
+
+
+def plot_swarm(title: str, swarm: Swarm, iterations: int, xmin: float, ymin: float, zmin: float, fmin: float, space: dict, z_lim: tuple, alpha: float, obj, gif_path,
+               trajectory: Trajectory = None, stop=None, processes: int = None,
+               quiver_interval: int = SwarmRenderer.QUIVER_INTERVAL, max_arrows: int = SwarmRenderer.MAX_ARROWS):
+    # Otimiza sem renderizar e só depois repete o registro na animação
+    if trajectory is None:
+        trajectory = swarm.record(iterations, stop, dimensions=3)
+    renderer = SwarmRenderer(trajectory, title, xmin, ymin, zmin, fmin, space, z_lim, alpha, obj, iterations,
+                             quiver_interval, max_arrows)
+
+    # Quadros desenhados em paralelo, cada processo com sua figura
     print("Salvando animação...")
-    try:
-        # Tenta primeiro com o writer padrão
-        anim.save(gif_path, writer='pillow', fps=10, dpi=100, 
-                 savefig_kwargs={'facecolor': 'white'})
-        print(f"Animação salva com sucesso em: {gif_path}")
-    except Exception as e:
-        print(f"Erro ao salvar com pillow: {e}")
-        print("Tentando método alternativo...")
-        
-        # Método manual de captura de frames
-        frames = []
-        for i in range(iterations):
-            animate(i)
-            fig.canvas.draw()
-            frame = np.array(fig.canvas.renderer.buffer_rgba())
-            frames.append(frame)
-            print(f"Frame {i+1}/{iterations} processado", end='\r')
-        
-        imageio.mimsave(gif_path, frames, fps=10)
-        print(f"\nAnimação salva via imageio em: {gif_path}")
-
-    plt.close()
+    render_gif(renderer, len(trajectory), gif_path, fps=10, processes=processes)
+    print(f"Animação salva com sucesso em: {gif_path}")
+    return trajectory
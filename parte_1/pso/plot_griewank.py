@@ -1,14 +1,15 @@
+import os
+import sys
+
 import numpy as np
 
 from swarm import Swarm
 from plot import plot_swarm
 
-def griewank(x, y, z):
-    sum_part = (x**2 + y**2 + z**2) / 4000
-    prod_part = (np.cos(x/np.sqrt(1)) * 
-                np.cos(y/np.sqrt(2)) * 
-                np.cos(z/np.sqrt(3)))
-    return sum_part - prod_part + 1
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import griewank
+from comum.stopping import StopCriteria
+
 
 def main():
     gif_path = "gifs/griewank_PSO.gif"
@@ -29,12 +30,15 @@ def main():
              "resolution": 200
             }
     
-    xmin = 0
-    ymin = 0
-    zmin = 0
-    fmin = griewank(xmin, ymin, zmin) # valor mínimo conhecido
+    xmin, ymin, zmin = griewank.optimum(3)
+    fmin = griewank.fmin(3) # valor mínimo conhecido
+
+    objective = griewank  # objetivo em lote: avalia o enxame inteiro numa chamada
+
+    swarm = Swarm(objective, NUM_PARTICLES, w, c1, c2, bounds[0], bounds[1])
 
-    swarm = Swarm(griewank, NUM_PARTICLES, w, c1, c2, bounds[0], bounds[1])
+    # Para antes do limite quando chega ao mínimo conhecido ou estagna
+    stop = StopCriteria(target=fmin, epsilon=1e-4, patience=30)
     
     plot_swarm(title="Griewank PSO",
                swarm=swarm,
@@ -46,8 +50,11 @@ def main():
                space=space,
                z_lim=(0, 400),
                alpha=alpha,
-               obj=griewank,
-               gif_path=gif_path)
+               obj=objective,
+               gif_path=gif_path,
+               stop=stop)
+    report = stop.report()
+    print(f"Parada: {report.reason} após {report.generations} iterações e {report.evaluations} avaliações")
     
 
 if __name__ == "__main__":
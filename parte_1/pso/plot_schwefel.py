@@ -1,14 +1,15 @@
+import os
+import sys
+
 import numpy as np
 
 from swarm import Swarm
 from plot import plot_swarm
 
-def schwefel(x, y, z):
-    x_sin = x * np.sin(np.sqrt(np.abs(x)))
-    y_sin = y * np.sin(np.sqrt(np.abs(y)))
-    z_sin = z * np.sin(np.sqrt(np.abs(z)))
-    return (418.9829 * 3) - (x_sin + y_sin + z_sin)
-    
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.benchmarks import schwefel
+from comum.stopping import StopCriteria
+
 
 def main():
     gif_path = "gifs/schwefel_PSO.gif"
@@ -29,12 +30,15 @@ def main():
              "resolution": 400
             }
     
-    xmin = 420.9687
-    ymin = 420.9687
-    zmin = 420.9687
-    fmin = schwefel(xmin, ymin, zmin) # valor mínimo conhecido
+    xmin, ymin, zmin = schwefel.optimum(3)
+    fmin = schwefel.fmin(3) # valor mínimo conhecido
+
+    objective = schwefel  # objetivo em lote: avalia o enxame inteiro numa chamada
+
+    swarm = Swarm(objective, NUM_PARTICLES, w, c1, c2, bounds[0], bounds[1])
 
-    swarm = Swarm(schwefel, NUM_PARTICLES, w, c1, c2, bounds[0], bounds[1])
+    # Para antes do limite quando chega ao mínimo conhecido ou estagna
+    stop = StopCriteria(target=fmin, epsilon=1e-4, patience=30)
     
     plot_swarm(title="Schwefel PSO",
                swarm=swarm,
@@ -46,8 +50,11 @@ def main():
                space=space,
                z_lim=(0, 1300),
                alpha=alpha,
-               obj=schwefel,
-               gif_path=gif_path)
+               obj=objective,
+               gif_path=gif_path,
+               stop=stop)
+    report = stop.report()
+    print(f"Parada: {report.reason} após {report.generations} iterações e {report.evaluations} avaliações")
     
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
+import os
+import sys
+
 import numpy as np
 from typing import Tuple
 from particle import Particle
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from comum.objective import evaluate
+from comum.stopping import StopCriteria, StopReport
+from comum.trajectory import Trajectory
+
 class Swarm:
     def __init__(self, fitness, num_particles: int, w: float, c1: float, c2: float,
-                 upperBound: np.ndarray, lowerBound: np.ndarray):
+                 upperBound: np.ndarray, lowerBound: np.ndarray, evaluator=None):
         self.fitness = fitness
         self.num_particles = num_particles
         self.w = w
@@ -13,59 +21,107 @@ class Swarm:
         self.upperBound = upperBound
         self.lowerBound = lowerBound
         self.bounds = (upperBound, lowerBound)
+        self.evaluator = evaluator  # backend de comum.evaluators; None avalia no próprio processo
+        self.evaluations = 0  # chamadas acumuladas ao objetivo, por partícula
+        self.num_dimensions = len(np.atleast_1d(upperBound))
         
-        self.particles = None
+        # Estrutura de arrays: linha i de cada array é a partícula i
+        self.positions = None       # (N, D)
+        self.velocities = None      # (N, D)
+        self.best_positions = None  # (N, D)
+        self.values = None          # (N,) valores das posições atuais
+        self.best_values = None     # (N,)
         self.best_global_position = None
         self.best_global_value = float('inf')
         self._initialize_swarm()
         self._initialize_global_best_position_and_value()
 
-    def _initialize_swarm(self) -> list[Particle]:
-        pos_components = np.random.uniform(self.lowerBound, self.upperBound, (self.num_particles, 3))
-        vel_components = np.random.uniform(-1, 1, (self.num_particles, 3)) * 0.1
-        particles = []
-        for i in range(self.num_particles):
-            particle = Particle(pos_components[i], vel_components[i])
-            particle.best_value = self.fitness(*particle.position)
-            particles.append(particle)
-        self.particles = particles
+    @property
+    def particles(self) -> list[Particle]:
+        return [Particle(self, i) for i in range(self.num_particles)]
+
+    def _initialize_swarm(self):
+        shape = (self.num_particles, self.num_dimensions)
+        self.positions = np.random.uniform(self.lowerBound, self.upperBound, shape)
+        self.velocities = np.random.uniform(-1, 1, shape) * 0.1
+        self.best_positions = self.positions.copy()
+        self.values = self._evaluate(self.positions)
+        self.best_values = self.values.copy()
         return
 
     def _initialize_global_best_position_and_value(self):
-        for p in self.particles:
-            current_value = self.fitness(*p.position)
-            if current_value < self.best_global_value:
-                self.best_global_value = current_value
-                self.best_global_position = p.position.copy()
+        self._update_global_best()
         return
 
+    def _update_global_best(self):
+        best = np.argmin(self.best_values)
+        if self.best_values[best] < self.best_global_value:
+            self.best_global_value = self.best_values[best]
+            self.best_global_position = self.best_positions[best].copy()
+        return
+
+    def _evaluate(self, positions: np.ndarray) -> np.ndarray:
+        values = evaluate(self.fitness, positions, evaluator=self.evaluator)
+        self.evaluations += len(values)
+        return values
+
     def optimize(self):
         self._update_particles()
         return
 
+    def run(self, max_iterations: int, stop: StopCriteria = None) -> StopReport:
+        # Executa até max_iterations ou até um critério de stop disparar
+        stop = stop or StopCriteria()
+        stop.start(maximize=False)
+        for _ in range(max_iterations):
+            self.optimize()
+            if stop.check(self.best_global_value, self.positions, self.evaluations):
+                break
+        return stop.report()
+
+    def record(self, max_iterations: int, stop: StopCriteria = None, dimensions: int = None) -> Trajectory:
+        # Como run, mas guarda o estado de cada iteração para renderizar depois
+        trajectory = Trajectory(dimensions)
+        stop = stop or StopCriteria()
+        stop.start(maximize=False)
+        for _ in range(max_iterations):
+            self.optimize()
+            trajectory.append(self.positions, self.values, self.best_global_position,
+                              self.best_global_value, self.velocities)
+            if stop.check(self.best_global_value, self.positions, self.evaluations):
+                break
+        return trajectory
+
     def _update_particles(self):
-        for p in self.particles:
-            p.update_velocity(self.w, self.c1, self.c2, self.best_global_position)
-            p.update_position(self.bounds)
-            
-            # Avalia nova posição
-            current_value = self.fitness(*p.position)
-            
-            # Atualiza melhor posição individual
-            if current_value < p.best_value:
-                p.best_value = current_value
-                p.best_position = p.position.copy()
-                
-                # Atualiza melhor posição global
-                if current_value < self.best_global_value:
-                    self.best_global_value = current_value
-                    self.best_global_position = p.position.copy()
+        # Um sorteio r1, r2 por partícula, como no Particle.update_velocity
+        r1 = np.random.rand(self.num_particles, 1)
+        r2 = np.random.rand(self.num_particles, 1)
+        cognitive = self.c1 * r1 * (self.best_positions - self.positions)
+        social = self.c2 * r2 * (self.best_global_position - self.positions)
+        self.velocities *= self.w
+        self.velocities += cognitive + social
+        
+        # Confinamento dentro dos limites
+        self.positions += self.velocities
+        np.clip(self.positions, self.lowerBound, self.upperBound, out=self.positions)
+        
+        # Avalia todas as novas posições numa única chamada (objetivos em lote)
+        values = self.values = self._evaluate(self.positions)
+        
+        # Atualiza melhores posições individuais
+        improved = values < self.best_values
+        self.best_values[improved] = values[improved]
+        self.best_positions[improved] = self.positions[improved]
+        
+        # Atualiza melhor posição global
+        self._update_global_best()
         return
 
     def get_swarm_status(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        positions = np.array([p.position for p in self.particles]).T
-        velocities = np.array([p.velocity for p in self.particles]).T
-        best_positions = np.array([p.best_position for p in self.particles]).T
-        global_best = self.best_global_position.reshape(3, 1)
+        # Visões transpostas (D, N) dos arrays do enxame, sem cópia
+        positions = self.positions.T
+        velocities = self.velocities.T
+        best_positions = self.best_positions.T
+        global_best = self.best_global_position.reshape(self.num_dimensions, 1)
         
-        return positions, velocities, best_positions, global_best
\ No newline at end of file
+        return positions, velocities, best_positions, global_best
@@ -0,0 +1,197 @@
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from instances import generate
+from genetics_numpy import items_to_arrays
+
+# Reference solvers for the knapsack GA: exact DP, ratio greedy and the LP upper bound
+
+MAX_DP_CELLS = 50_000_000  # Largest DP row, in cells of 8 bytes, whatever the scale
+MAX_DECISION_BYTES = 256 * 2**20  # Packed choice bits kept for reconstructing the DP solution
+MAX_DECIMALS = 6  # Finest weight resolution the automatic scale looks for
+
+class Solution(NamedTuple):
+    value: float  # Total value of the selected items
+    weight: float  # Total (unscaled) weight of the selected items
+    selected: np.ndarray  # Boolean mask over the items, None when not reconstructed
+    elapsed: float  # Solver wall time in seconds
+
+# Smallest power of 10 that turns every weight into an integer, within the DP memory budget
+def weight_scale(weights, max_weight, max_cells=MAX_DP_CELLS):
+    scale = 1
+    for _ in range(MAX_DECIMALS):
+        scaled = weights * scale
+        if np.allclose(scaled, np.round(scaled), rtol=0, atol=1e-6):
+            break
+        if max_weight * scale * 10 > max_cells:
+            break  # Coarser than exact: ceil below keeps the answer feasible
+        scale *= 10
+    return scale
+
+# Integer weights rounded up and capacity rounded down, so every scaled solution fits the real knapsack
+def scale_problem(weights, max_weight, scale):
+    tolerance = 1e-9
+    scaled_weights = np.ceil(weights * scale - tolerance).astype(np.int64)
+    capacity = int(math.floor(max_weight * scale + tolerance))
+    return scaled_weights, capacity
+
+# Bytes of packed choice bits the DP keeps to reconstruct its solution
+def decision_bytes(scaled_weights, capacity):
+    fitting = scaled_weights[scaled_weights <= capacity]
+    return int(np.sum((capacity + 1 - fitting + 7) // 8))
+
+# 0/1 knapsack by dynamic programming over capacities, keeping a single row of best values
+# (exact when scale makes the weights integral, otherwise optimal for the rounded-up weights).
+# Raises ValueError before allocating when the row exceeds max_cells or, with reconstruct,
+# the choice bits exceed MAX_DECISION_BYTES: use lp_bound as the reference for such instances
+def dynamic_programming(items, max_weight, scale=None, reconstruct=True, max_cells=MAX_DP_CELLS):
+    start = time.perf_counter()
+    values, weights = items_to_arrays(items)
+    scale = scale or weight_scale(weights, max_weight, max_cells)
+    scaled_weights, capacity = scale_problem(weights, max_weight, scale)
+
+    if capacity + 1 > max_cells:
+        raise ValueError(f"DP row needs {capacity + 1} cells (capacity {max_weight:g} at scale {scale}), "
+                         f"above max_cells={max_cells}")
+    needed = decision_bytes(scaled_weights, capacity) if reconstruct else 0
+    if needed > MAX_DECISION_BYTES:
+        raise ValueError(f"DP choice bits need {needed} bytes, above "
+                         f"MAX_DECISION_BYTES={MAX_DECISION_BYTES}; pass reconstruct=False for the value only")
+
+    row = np.zeros(capacity + 1)  # row[c] = best value with capacity c using the items seen so far
+    decisions = [] if reconstruct else None  # One packed bit per (item, capacity): item taken or not
+    for value, weight in zip(values, scaled_weights):
+        if weight > capacity:
+            if reconstruct:
+                decisions.append(None)
+            continue
+        candidate = row[:capacity + 1 - weight] + value  # Built from the previous row before any write
+        taken = candidate > row[weight:]
+        np.maximum(row[weight:], candidate, out=row[weight:])
+        if reconstruct:
+            decisions.append((weight, np.packbits(taken)))
+
+    selected = None
+    if reconstruct:
+        selected = np.zeros(len(values), dtype=bool)
+        c = capacity
+        for i in range(len(values) - 1, -1, -1):  # Walk the choices backwards from full capacity
+            if decisions[i] is None:
+                continue
+            weight, taken = decisions[i]
+            if c >= weight and taken[(c - weight) >> 3] & (0x80 >> ((c - weight) & 7)):
+                selected[i] = True
+                c -= weight
+    best_value = float(row[capacity])
+    total_weight = float(weights[selected].sum()) if selected is not None else float("nan")
+    return Solution(best_value, total_weight, selected, time.perf_counter() - start)
+
+# Item indexes by decreasing value/weight ratio (zero weights first)
+def ratio_order(values, weights):
+    with np.errstate(divide="ignore"):
+        ratios = np.where(weights > 0, values / weights, np.inf)
+    return np.argsort(-ratios, kind="stable")
+
+# Take items by decreasing ratio while they fit, then keep the better of that and the best single item
+def greedy(items, max_weight):
+    start = time.perf_counter()
+    values, weights = items_to_arrays(items)
+    selected = np.zeros(len(values), dtype=bool)
+    remaining = max_weight
+    for i in ratio_order(values, weights).tolist():
+        if weights[i] <= remaining:
+            selected[i] = True
+            remaining -= weights[i]
+
+    fitting = np.flatnonzero(weights <= max_weight)
+    if len(fitting):
+        best_single = fitting[np.argmax(values[fitting])]
+        if values[best_single] > values[selected].sum():  # Guarantees at least half of the optimum
+            selected[:] = False
+            selected[best_single] = True
+    return Solution(float(values[selected].sum()), float(weights[selected].sum()), selected, time.perf_counter() - start)
+
+# Dantzig bound: optimum of the LP relaxation, whole items by ratio plus a fraction of the critical one
+def lp_bound(items, max_weight):
+    values, weights = items_to_arrays(items)
+    order = ratio_order(values, weights)
+    cumulative_weight = np.cumsum(weights[order])
+    critical = np.searchsorted(cumulative_weight, max_weight, side="right")  # First item that no longer fits
+    bound = values[order[:critical]].sum()
+    if critical < len(order):
+        room = max_weight - (cumulative_weight[critical - 1] if critical else 0.0)
+        bound += values[order[critical]] * room / weights[order[critical]]
+    return float(bound)
+
+# Relative distance from value to the reference (optimum or upper bound)
+def optimality_gap(value, reference):
+    if reference == 0:
+        return 0.0
+    return (reference - value) / abs(reference)
+
+# on_generation callback for GeneticAlgorithm.run: records when the best fitness first
+# comes within each gap threshold of the reference. Create it right before the run.
+class GapTracker:
+    def __init__(self, reference, thresholds=(0.10, 0.05, 0.01, 0.0)):
+        self.reference = reference
+        self.thresholds = sorted(thresholds, reverse=True)
+        self.reached = {}  # threshold -> (generation, seconds since start)
+        self.best = float("-inf")
+        self.generations = 0
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+
+    def __call__(self, generation, fitness_values, best_fitness_ever):
+        self.best = best_fitness_ever
+        self.generations = generation + 1
+        self.elapsed = time.perf_counter() - self.start
+        gap = self.gap
+        for threshold in self.thresholds:
+            if threshold not in self.reached and gap <= threshold + 1e-12:
+                self.reached[threshold] = (generation, self.elapsed)
+
+    @property
+    def gap(self):
+        return optimality_gap(self.best, self.reference)
+
+    def __str__(self):
+        lines = [f"Optimality gap: {self.gap:.2%} (best {self.best:g} vs reference {self.reference:g}, "
+                 f"{self.generations} generations in {self.elapsed:.3f} s)"]
+        for threshold in self.thresholds:
+            if threshold in self.reached:
+                generation, seconds = self.reached[threshold]
+                lines.append(f"  gap <= {threshold:.0%}: generation {generation}, {seconds:.3f} s")
+            else:
+                lines.append(f"  gap <= {threshold:.0%}: not reached")
+        return "\n".join(lines)
+
+# Compare the GA against the baselines on the example items and on generated instances
+def main():
+    from genetics import ELITE_COUNT, GeneticAlgorithm, ITEMS, MAX_WEIGHT
+
+    problems = [("example ITEMS", ITEMS, MAX_WEIGHT)]
+    for kind in ("uncorrelated", "strongly_correlated"):
+        instance = generate(200, kind, seed=7)
+        problems.append((f"{kind} n=200", instance, instance.max_weight))
+
+    for name, items, max_weight in problems:
+        print(f"== {name} ==")
+        optimum = dynamic_programming(items, max_weight)
+        heuristic = greedy(items, max_weight)
+        bound = lp_bound(items, max_weight)
+        print(f"DP:     {optimum.value:g} (weight {optimum.weight:g}/{max_weight:g}) in {optimum.elapsed:.3f} s")
+        print(f"Greedy: {heuristic.value:g}, gap {optimality_gap(heuristic.value, optimum.value):.2%} in {heuristic.elapsed:.4f} s")
+        print(f"LP bound: {bound:g}")
+
+        for repair in (None, "fill"):  # Penalty only, then with the opt-in repair stage
+            tracker = GapTracker(optimum.value)
+            GeneticAlgorithm(items=list(items), max_weight=max_weight, generations=100, elitism=ELITE_COUNT,
+                             repair=repair, seed=0).run(on_generation=tracker, verbose=False)
+            print(f"GA (repair={repair}): {tracker}")
+
+
+if __name__ == "__main__":
+    main()
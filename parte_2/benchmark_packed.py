@@ -0,0 +1,40 @@
+import resource
+import time
+
+import numpy as np
+
+from genetics_numpy import roulette_selection
+import genetics_packed as packed
+from instances import generate
+
+
+def main():
+    POPULATION = 1000
+    NUM_ITEMS = 1_000_000
+    MUTATION_RATE = 1 / NUM_ITEMS  # ~1 flip per genome, the usual rate for long genomes
+    rng = np.random.default_rng(42)
+
+    instance = generate(NUM_ITEMS, "uncorrelated", capacity_fraction=0.25, seed=42)
+    values, weights, max_weight = instance.values, instance.weights, instance.max_weight
+
+    population = packed.ini_population(rng, POPULATION, NUM_ITEMS)
+    print(f"Population: {POPULATION} x {NUM_ITEMS} genes = {population.nbytes / 2**20:.0f} MB packed")
+
+    for generation in range(3):
+        start = time.perf_counter()
+        fitness_values = packed.fitness(population, values, weights, max_weight, NUM_ITEMS)
+        evaluated = time.perf_counter()
+        
+        pairs = POPULATION // 2
+        parents = roulette_selection(rng, population, fitness_values, 2 * pairs)
+        packed.crossover(rng, parents[:pairs], parents[pairs:], 0.5, NUM_ITEMS)
+        population = packed.mutate(rng, parents, MUTATION_RATE, NUM_ITEMS)
+        end = time.perf_counter()
+        print(f"Generation {generation}: {end - start:.3f} s (fitness {evaluated - start:.3f} s)")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Peak resident memory: {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Compact key for a 0/1 genome: its genes packed 8 per byte
+def genome_key(genome):
+    return np.packbits(np.asarray(genome, dtype=np.uint8)).tobytes()
+
+# Memoize a fitness function on genome contents, evicting the least recently used entries.
+# Optional: keying costs a packbits and dict lookups per genome, more than the O(1) knapsack
+# fitness itself, so use it only when each evaluation is expensive (simulations, remote calls)
+class FitnessCache:
+    def __init__(self, fitness, maxsize=100_000, key=genome_key):
+        self.fitness = fitness  # Wrapped fitness function
+        self.maxsize = maxsize  # Maximum number of stored genomes
+        self.key = key  # Genome -> hashable key (use row.tobytes() for packed rows)
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()  # key -> fitness, oldest first
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _store(self, key, value):
+        self._values[key] = value
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)  # Evict the least recently used genome
+
+    def __call__(self, genome):
+        key = self.key(genome)
+        if key in self._values:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return self._values[key]
+        self.misses += 1
+        value = self.fitness(genome)
+        self._store(key, value)
+        return value
+
+    # Evaluate a whole generation: only distinct, unseen genomes reach the fitness function
+    def map(self, population, evaluator=None):
+        keys = [self.key(genome) for genome in population]
+        missing = {}  # key -> first genome with that key
+        for genome, key in zip(population, keys):
+            if key in self._values:
+                self._values.move_to_end(key)
+            elif key not in missing:
+                missing[key] = genome
+        self.misses += len(missing)
+        self.hits += len(keys) - len(missing)
+
+        genomes = list(missing.values())
+        if evaluator is None:
+            values = [self.fitness(genome) for genome in genomes]
+        else:
+            values = evaluator.map(self.fitness, genomes)  # Results come back in genome order
+        computed = dict(zip(missing, values))
+        results = [computed[key] if key in computed else self._values[key] for key in keys]
+
+        for key, value in computed.items():
+            self._store(key, value)
+        return results
+
+    def clear(self):
+        self._values.clear()
+        self.hits = self.misses = 0
+
+    def __str__(self):
+        return f"Fitness cache: {self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate), {len(self._values)} stored"
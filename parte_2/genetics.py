@@ -1,10 +1,27 @@
+import heapq
+import math
+import os
 import random
+import sys
+from itertools import accumulate, compress
+from multiprocessing import Pool
 
-# Constants for genetic algorithm
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from comum.stopping import StopCriteria
+from genetics_numpy import repair, repair_order, tournament_indexes
+
+# Default constants for genetic algorithm
 POPULATION_SIZE = 400  # Number of individuals in each generation
 MUTATION_RATE = 0.25    # Probability of mutating a gene
 CROSSOVER_RATE = 0.5    # Probability of performing crossover
 GENERATIONS = 310      # Number of generations to run the algorithm
+SELECTION_METHOD = "roulette"  # Parent selection operator: "roulette" or "tournament"
+TOURNAMENT_SIZE = 3    # Number of competitors in each tournament
+ELITISM = 0            # Best genomes carried unchanged into the next generation (0 keeps full replacement)
+ELITE_COUNT = 2        # Elitism used by the drivers below
+REPAIR = None          # Overweight genomes: None keeps the penalty only, "drop" or "fill" repairs them
 
 # Example knapsack problem parameters
 ITEMS = [  # List of available items (value, weight) pairs
@@ -15,121 +32,282 @@ ITEMS = [  # List of available items (value, weight) pairs
     ]
 GENOME_LENGTH = len(ITEMS)  # Number of items available
 MAX_WEIGHT = 110  # Knapsack weight capacity
+WEIGHT_TOLERANCE = 1e-9  # Absorbs rounding drift of incrementally tracked weights
 
-# Generate a random genome (binary representation of item selection)
-def random_genome(length):
-    return [random.randint(0, 1) for _ in range(length)]  # 0 means not selected, 1 means selected
-
-# Initialize a population with random genomes
-def ini_population(population_size, genome_length):
-    return [random_genome(genome_length) for _ in range(population_size)]  # Create multiple random genomes
+# A genome (list of 0/1 genes) that carries the totals of its selected items
+class Genome(list):
+    def __init__(self, genes, value, weight):
+        super().__init__(genes)
+        self.value = value  # Total value of selected items
+        self.weight = weight  # Total weight of selected items
 
+    def copy(self):
+        return Genome(self, self.value, self.weight)
 
-
-# Compute fitness of a genome
-def fitness(genome):
-    total_value = 0  # Total value of selected items
-    total_weight = 0  # Total weight of selected items
-    
-    # Iterate through genome to calculate total value and weight
-    for i, selected in enumerate(genome):
-        if selected:  # If item is selected
-            value, weight = ITEMS[i]  # Retrieve value and weight
-            total_value += value  # Accumulate value
-            total_weight += weight  # Accumulate weight
-    
-    # Penalize solutions that exceed the weight limit
-    if total_weight > MAX_WEIGHT:
-        excess = total_weight - MAX_WEIGHT
-        return -excess  # Negative penalty for exceeding weight
-    return total_value  # Higher value is better
-
-
-
-# Select a parent using a fitness-based selection (roulette wheel method)
-def selection_parents(population, fitness_values):
-    min_fitness = min(fitness_values)  # Find the lowest fitness value
-    adjusted_fitness = [f + min_fitness + 1 for f in fitness_values]  
-    
-    total_fitness = sum(adjusted_fitness)  # Sum of all fitness values
-    pick = random.uniform(0, total_fitness)  # Random pick in the fitness range
-    current = 0  # Cumulative sum tracker
-    for individual, fitness_value in zip(population, adjusted_fitness):
-        current += fitness_value
-        if current > pick:
-            return individual  # Select the corresponding individual
-    return population[-1]  # Fallback in case of rounding issues
-
-# Perform crossover between two parents to create offspring
-def crossover(parent1, parent2):
-    if random.random() < CROSSOVER_RATE:  # Apply crossover with given probability
-        crossover_point = random.randint(1, GENOME_LENGTH - 1)  # Choose a random point
-        child1 = parent1[:crossover_point] + parent2[crossover_point:]  # First offspring
-        child2 = parent1[crossover_point:] + parent2[:crossover_point]  # Second offspring
-        return child1, child2
-    else:
-        return parent1, parent2  # No crossover, return parents unchanged
-
-# Apply mutation to a genome (random bit flip)
-def mutate(genome):
-    for i in range(len(genome)):
-        if random.random() < MUTATION_RATE:  # Check mutation probability
-            genome[i] = abs(genome[i] - 1)  # Flip bit (0 -> 1, 1 -> 0)
-    return genome
-
-# Print the best solution found
-def print_solution(genome):
+# Print a solution of the knapsack problem given by items and max_weight
+def print_solution(genome, items=ITEMS, max_weight=MAX_WEIGHT):
     total_value = 0  # Total value of selected items
     total_weight = 0  # Total weight of selected items
     selected_items = []  # List of selected item indices
-    
+
     # Iterate through genome to determine selected items
     for i, selected in enumerate(genome):
         if selected:
-            value, weight = ITEMS[i]
+            value, weight = items[i]
             total_value += value
             total_weight += weight
             selected_items.append(i)  # Store selected item index
-    
+
     print(f"Selected items (indices): {selected_items}")
     print(f"Total value: {total_value}")
-    print(f"Total weight: {total_weight}/{MAX_WEIGHT}")
-
-# Main genetic algorithm function
-def genetic_algorithm():
-    population = ini_population(POPULATION_SIZE, GENOME_LENGTH)  # Initialize population
-    best_solution = None  # Store best solution found
-    best_fitness_ever = float('-inf')  # Track highest fitness value
-    
-    # Run genetic algorithm for a defined number of generations
-    for generation in range(GENERATIONS):
-        fitness_values = [fitness(genome) for genome in population]  # Evaluate fitness
-        current_best = max(fitness_values)  # Find the best fitness in this generation
-        
-        # Track the best solution found so far
-        if current_best > best_fitness_ever:
-            best_fitness_ever = current_best
-            best_index = fitness_values.index(current_best)
-            best_solution = population[best_index].copy()  # Store best genome
-        
-        # Create next generation
-        new_population = []
-        for _ in range(POPULATION_SIZE // 2):  # Each iteration generates two offspring
-            parent1 = selection_parents(population, fitness_values)  # Select first parent
-            parent2 = selection_parents(population, fitness_values)  # Select second parent
-            offspring1, offspring2 = crossover(parent1, parent2)  # Perform crossover
-            new_population.extend([mutate(offspring1), mutate(offspring2)])  # Apply mutation and add to new population
-        
-        population = new_population  # Replace old population with new generation
-        
-        if generation % 10 == 0:
-            print(f"Generation {generation}: Best fitness = {best_fitness_ever}")
-    
-    # Display final best solution
-    print("\nFinal Results:")
-    print_solution(best_solution)
-    print(f"Best fitness achieved: {best_fitness_ever}")
+    print(f"Total weight: {total_weight}/{max_weight}")
+
+# A knapsack GA instance: owns the problem, the operator settings and its own RNG,
+# so several instances can run side by side in one process or across a worker pool
+class GeneticAlgorithm:
+    def __init__(self, items=ITEMS, max_weight=MAX_WEIGHT,
+                 population_size=POPULATION_SIZE, mutation_rate=MUTATION_RATE,
+                 crossover_rate=CROSSOVER_RATE, generations=GENERATIONS,
+                 selection_method=SELECTION_METHOD, tournament_size=TOURNAMENT_SIZE,
+                 elitism=ELITISM, repair=REPAIR, seed=None):
+        self.items = list(items)  # List of available items (value, weight) pairs
+        self.values = [value for value, _ in self.items]  # Item values, aligned with the genome
+        self.weights = [weight for _, weight in self.items]  # Item weights, aligned with the genome
+        self.genome_length = len(self.items)  # Number of items available
+        self.max_weight = max_weight  # Knapsack weight capacity
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+        self.generations = generations
+        self.selection_method = selection_method
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.repair_mode = repair
+        self.rng = random.Random(seed)  # Private RNG: runs do not disturb each other
+        self.np_rng = np.random.default_rng(seed)  # Private RNG of the vectorized operators
+
+    # Sum value and weight of the selected items in genome[start:stop]
+    def segment_totals(self, genome, start=0, stop=None):
+        selected = genome[start:stop]
+        return sum(compress(self.values[start:stop], selected)), sum(compress(self.weights[start:stop], selected))
+
+    # Totals of genome[:point], walking whichever side of the point is shorter
+    def prefix_totals(self, genome, point):
+        if point <= len(genome) // 2:
+            return self.segment_totals(genome, 0, point)
+        suffix_value, suffix_weight = self.segment_totals(genome, point)
+        return genome.value - suffix_value, genome.weight - suffix_weight
+
+    # Build a genome from its genes, computing its totals with one full walk
+    def make_genome(self, genes):
+        genome = Genome(genes, 0, 0)
+        genome.value, genome.weight = self.segment_totals(genome)
+        return genome
+
+    # Generate a random genome (binary representation of item selection)
+    def random_genome(self):
+        return self.make_genome([self.rng.randint(0, 1) for _ in range(self.genome_length)])  # 0 means not selected, 1 means selected
+
+    # Initialize a population with random genomes
+    def ini_population(self):
+        return self.repair_population([self.random_genome() for _ in range(self.population_size)])  # Create multiple random genomes
+
+    # Compute fitness of a genome
+    def fitness(self, genome):
+        if isinstance(genome, Genome):  # Totals are already tracked: O(1)
+            total_value, total_weight = genome.value, genome.weight
+        else:
+            total_value, total_weight = self.segment_totals(genome)
+
+        # Penalize solutions that exceed the weight limit
+        if total_weight > self.max_weight + WEIGHT_TOLERANCE:
+            excess = total_weight - self.max_weight
+            return -excess  # Negative penalty for exceeding weight
+        return total_value  # Higher value is better
+
+    # Evaluate a whole generation, optionally memoized and/or on a comum.evaluators backend.
+    # self.fitness is O(1) from the tracked totals, so a FitnessCache only pays off for expensive evaluators
+    def evaluate_population(self, population, evaluator=None, cache=None):
+        if cache is not None:
+            return cache.map(population, evaluator)  # Only unseen genomes are evaluated
+        if evaluator is None:
+            return [self.fitness(genome) for genome in population]
+        return evaluator.map(self.fitness, population)  # Results come back in population order
+
+    # Select all parents of a generation with the configured operator
+    def selection_parents(self, population, fitness_values, count):
+        if self.selection_method == "tournament":
+            return self.tournament_selection(population, fitness_values, count)
+        return self.roulette_selection(population, fitness_values, count)
+
+    # Fitness-based selection (roulette wheel method), O(log N) per draw
+    def roulette_selection(self, population, fitness_values, count):
+        min_fitness = min(fitness_values)  # Find the lowest fitness value
+        adjusted_fitness = [f - min_fitness + 1 for f in fitness_values]  # Shift so every weight is positive
+
+        cumulative = list(accumulate(adjusted_fitness))  # Built once per generation
+        return self.rng.choices(population, cum_weights=cumulative, k=count)  # Binary search for each pick
+
+    # Pick the fittest of tournament_size random individuals, count times: all tournaments are
+    # drawn as one (count, tournament_size) array and decided by an argmax per row
+    def tournament_selection(self, population, fitness_values, count):
+        indexes = tournament_indexes(self.np_rng, np.asarray(fitness_values), count, self.tournament_size)
+        return [population[i] for i in indexes.tolist()]
+
+    # Perform crossover between two parents to create offspring
+    def crossover(self, parent1, parent2):
+        if self.rng.random() < self.crossover_rate:  # Apply crossover with given probability
+            crossover_point = self.rng.randint(1, self.genome_length - 1)  # Choose a random point
+            prefix1_value, prefix1_weight = self.prefix_totals(parent1, crossover_point)
+            prefix2_value, prefix2_weight = self.prefix_totals(parent2, crossover_point)
+            child1 = Genome(parent1[:crossover_point] + parent2[crossover_point:],  # First offspring
+                            prefix1_value + parent2.value - prefix2_value,
+                            prefix1_weight + parent2.weight - prefix2_weight)
+            child2 = Genome(parent2[:crossover_point] + parent1[crossover_point:],  # Second offspring
+                            prefix2_value + parent1.value - prefix1_value,
+                            prefix2_weight + parent1.weight - prefix1_weight)
+            return child1, child2
+        else:
+            return parent1, parent2  # No crossover, return parents unchanged
+
+    # Positions to flip: geometric gaps between flips, so the cost is O(flips)
+    def mutation_positions(self, length):
+        if self.mutation_rate <= 0:
+            return
+        if self.mutation_rate >= 1:
+            yield from range(length)
+            return
+        log_keep = math.log(1 - self.mutation_rate)
+        i = -1
+        while True:
+            i += 1 + int(math.log(1 - self.rng.random()) / log_keep)  # Genes skipped before the next flip
+            if i >= length:
+                return
+            yield i
+
+    # Apply mutation to a genome (random bit flip), copy-on-write: the input is never modified
+    def mutate(self, genome):
+        mutated = genome
+        for i in self.mutation_positions(len(genome)):
+            if mutated is genome:
+                mutated = genome.copy()  # First flip: work on a private copy
+            mutated[i] = abs(mutated[i] - 1)  # Flip bit (0 -> 1, 1 -> 0)
+            sign = 1 if mutated[i] else -1  # Item added or removed
+            mutated.value += sign * self.values[i]
+            mutated.weight += sign * self.weights[i]
+        return mutated
+
+    # Opt-in repair stage (repair=None keeps the penalty only): the whole batch goes through the
+    # vectorized genetics_numpy.repair and only the genomes it changes are rebuilt, so the inputs
+    # are never modified, like in mutate
+    def repair_population(self, population):
+        if not self.repair_mode:
+            return population
+        values, weights = np.array(self.values), np.array(self.weights)
+        genes = np.array(population, dtype=bool)
+        repaired = repair(genes, weights, self.max_weight + WEIGHT_TOLERANCE,
+                          repair_order(values, weights), self.repair_mode == "fill")
+        changed = np.flatnonzero((repaired != genes).any(axis=1))
+        rows = repaired[changed]
+        population = list(population)
+        for i, row, value, weight in zip(changed.tolist(), rows.astype(int).tolist(),
+                                         (rows @ values).tolist(), (rows @ weights).tolist()):
+            population[i] = Genome(row, value, weight)
+        return population
+
+    # Build the next generation: elites unchanged, then mutated offspring of selected parents
+    def next_generation(self, population, fitness_values):
+        new_population = [population[i] for i in elite_indexes(fitness_values, self.elitism)]  # Shared safely: mutate copies on write
+        pairs = (self.population_size - len(new_population) + 1) // 2
+        parents = self.selection_parents(population, fitness_values, 2 * pairs)  # Draw all parents at once
+        offspring = []
+        for i in range(0, len(parents), 2):  # Each iteration generates two offspring
+            offspring1, offspring2 = self.crossover(parents[i], parents[i + 1])  # Perform crossover
+            offspring.extend([self.mutate(offspring1), self.mutate(offspring2)])  # Mutate and add to the batch
+        new_population.extend(self.repair_population(offspring))  # Repair stage after mutate
+        return new_population[:self.population_size]
+
+    # Print the best solution found
+    def print_solution(self, genome):
+        print_solution(genome, self.items, self.max_weight)
+
+    # Main genetic algorithm loop; on_generation(generation, fitness_values, best_fitness_ever) observes each generation
+    def run(self, evaluator=None, stop=None, cache=None, on_generation=None, verbose=True):
+        population = self.ini_population()  # Initialize population
+        best_solution = None  # Store best solution found
+        best_fitness_ever = float('-inf')  # Track highest fitness value
+        evaluations = 0  # Real fitness calls so far (cache hits excluded)
+        generation_bests = []  # Best fitness of each generation (never decreases with elitism)
+        stop = stop or StopCriteria()  # No criteria: run every generation
+        stop.start(maximize=True)
+
+        # Run genetic algorithm for a defined number of generations
+        for generation in range(self.generations):
+            calls_before = cache.misses if cache is not None else 0
+            fitness_values = self.evaluate_population(population, evaluator, cache)  # Evaluate fitness
+            evaluations += cache.misses - calls_before if cache is not None else len(population)  # Cache hits cost no fitness call
+            current_best = max(fitness_values)  # Find the best fitness in this generation
+            generation_bests.append(current_best)
+
+            # Track the best solution found so far
+            if current_best > best_fitness_ever:
+                best_fitness_ever = current_best
+                best_index = fitness_values.index(current_best)
+                best_solution = population[best_index].copy()  # Store best genome
+
+            if on_generation is not None:
+                on_generation(generation, fitness_values, best_fitness_ever)
+
+            # Stop early once a criterion fires (target, stagnation, budget...)
+            if stop.check(best_fitness_ever, population, evaluations):
+                break
+
+            # Create next generation
+            population = self.next_generation(population, fitness_values)  # Replace old population with new generation
+
+            if verbose and generation % 10 == 0:
+                print(f"Generation {generation}: Best fitness = {best_fitness_ever}")
+
+        if verbose:
+            # Display final best solution
+            print("\nFinal Results:")
+            self.print_solution(best_solution)
+            print(f"Best fitness achieved: {best_fitness_ever}")
+            report = stop.report()
+            print(f"Stopped by: {report.reason} after {report.generations} generations and {report.evaluations} evaluations")
+            print(f"Generations where the best fitness decreased: {count_regressions(generation_bests)}")
+            if cache is not None:
+                print(cache)
+        return best_solution, best_fitness_ever, generation_bests
+
+# Indexes of the elite_count fittest genomes
+def elite_indexes(fitness_values, elite_count):
+    return heapq.nlargest(elite_count, range(len(fitness_values)), key=fitness_values.__getitem__)
+
+# Generations whose best fitness fell below the previous generation's best
+def count_regressions(generation_bests):
+    return sum(1 for previous, current in zip(generation_bests, generation_bests[1:]) if current < previous)
+
+# Run one configuration of a sweep (module level so worker processes can import it)
+def _run_settings(settings):
+    best_solution, best_fitness, generation_bests = GeneticAlgorithm(**settings).run(verbose=False)
+    return best_fitness, len(generation_bests)
+
+# Run many GeneticAlgorithm settings in parallel (keyword dicts, e.g. {"elitism": ELITE_COUNT, "seed": 0});
+# returns (best fitness, generations run) per setting
+def parameter_sweep(settings_list, processes=None):
+    with Pool(processes) as pool:
+        return pool.map(_run_settings, settings_list)
+
+# Main genetic algorithm function, with the module default settings
+def genetic_algorithm(evaluator=None, stop=None, cache=None, seed=None):
+    return GeneticAlgorithm(elitism=ELITE_COUNT, seed=seed).run(evaluator, stop, cache)
 
 # Run the genetic algorithm if script is executed directly
 if __name__ == "__main__":
-    genetic_algorithm()
+    from baselines import GapTracker, dynamic_programming  # baselines imports this module
+
+    ga = GeneticAlgorithm(elitism=ELITE_COUNT)
+    tracker = GapTracker(dynamic_programming(ga.items, ga.max_weight, reconstruct=False).value)
+    ga.run(stop=StopCriteria(patience=60), on_generation=tracker)
+    print(tracker)
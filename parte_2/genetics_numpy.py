@@ -0,0 +1,137 @@
+import numpy as np
+
+from instances import Instance
+
+# Vectorized engine: the population is an (N, L) boolean matrix, one genome per row.
+# Settings and problem come from a genetics.GeneticAlgorithm passed as ga, never from module globals
+
+# Split the (value, weight) pairs into contiguous vectors (an Instance already holds them)
+def items_to_arrays(items):
+    if isinstance(items, Instance):
+        return items.values, items.weights
+    values = np.array([value for value, _ in items], dtype=float)
+    weights = np.array([weight for _, weight in items], dtype=float)
+    return values, weights
+
+# Initialize a population with random genomes
+def ini_population(rng, population_size, genome_length):
+    return rng.random((population_size, genome_length)) < 0.5  # True means selected
+
+# Compute fitness of every genome with two matrix-vector products
+def fitness(population, values, weights, max_weight):
+    total_value = population @ values  # Total value of selected items, per genome
+    total_weight = population @ weights  # Total weight of selected items, per genome
+    
+    # Penalize solutions that exceed the weight limit
+    excess = total_weight - max_weight
+    return np.where(excess > 0, -excess, total_value)
+
+# Select all parents of a generation with the operator configured in ga
+def selection_parents(rng, population, fitness_values, count, ga):
+    if ga.selection_method == "tournament":
+        return tournament_selection(rng, population, fitness_values, count, ga.tournament_size)
+    return roulette_selection(rng, population, fitness_values, count)
+
+# Roulette wheel: one cumulative sum, all draws at once with binary search
+def roulette_selection(rng, population, fitness_values, count):
+    adjusted_fitness = fitness_values - fitness_values.min() + 1  # Shift so every weight is positive
+    cumulative = np.cumsum(adjusted_fitness)
+    picks = rng.random(count) * cumulative[-1]  # Random picks in the fitness range
+    indexes = np.searchsorted(cumulative, picks, side='right')
+    return population[np.minimum(indexes, len(population) - 1)]  # Guard against rounding at the top
+
+# Indexes of the winners of count tournaments of tournament_size random individuals, in one shot
+def tournament_indexes(rng, fitness_values, count, tournament_size):
+    competitors = rng.integers(0, len(fitness_values), (count, tournament_size))  # One tournament per row
+    winners = np.argmax(fitness_values[competitors], axis=1)  # Fittest competitor of each row
+    return competitors[np.arange(count), winners]
+
+def tournament_selection(rng, population, fitness_values, count, tournament_size):
+    return population[tournament_indexes(rng, fitness_values, count, tournament_size)]
+
+# Perform one-point crossover on each pair of rows
+def crossover(rng, parents1, parents2, crossover_rate):
+    pairs, genome_length = parents1.shape
+    crossover_points = rng.integers(1, genome_length, pairs)  # One random point per pair
+    from_parent1 = np.arange(genome_length) < crossover_points[:, None]
+    from_parent1 |= (rng.random(pairs) >= crossover_rate)[:, None]  # Pairs without crossover copy parent1
+    
+    child1 = np.where(from_parent1, parents1, parents2)
+    child2 = np.where(from_parent1, parents2, parents1)
+    return child1, child2
+
+# Apply mutation to every genome at once (random bit flip)
+def mutate(rng, population, mutation_rate):
+    return population ^ (rng.random(population.shape) < mutation_rate)
+
+# Item indexes by increasing value/weight ratio: the order in which repair drops items
+def repair_order(values, weights):
+    with np.errstate(divide="ignore"):
+        ratios = np.where(weights > 0, values / weights, np.inf)  # Weightless items are never dropped
+    return np.argsort(ratios, kind="stable")
+
+# Make every genome fit: drop selected items worst ratio first until the excess is gone,
+# then, with fill, add unselected items best ratio first while they still fit
+def repair(population, weights, max_weight, order, fill=False):
+    genes = population[:, order]  # Columns in drop order, one copy for the whole population
+    ordered_weights = weights[order]
+    carried = genes * ordered_weights
+    excess = carried.sum(axis=1) - max_weight
+    removed_before = np.cumsum(carried, axis=1) - carried  # Weight already dropped ahead of each item
+    genes &= removed_before >= excess[:, None]  # Keep an item once the earlier drops cover the excess
+
+    if fill:
+        room = max_weight - genes @ ordered_weights
+        for j in range(genes.shape[1] - 1, -1, -1):  # Best ratio first, all genomes at once
+            fits = ~genes[:, j] & (ordered_weights[j] <= room)
+            genes[:, j] |= fits
+            room -= fits * ordered_weights[j]
+
+    repaired = np.empty_like(population)
+    repaired[:, order] = genes  # Back to item order
+    return repaired
+
+# Main genetic algorithm function; ga defaults to a GeneticAlgorithm with the module default settings
+def genetic_algorithm(ga=None, seed=None):
+    if ga is None:
+        from genetics import GeneticAlgorithm  # genetics imports this module
+        ga = GeneticAlgorithm()
+    rng = np.random.default_rng(seed)
+    values, weights = items_to_arrays(ga.items)
+    max_weight, repair_mode = ga.max_weight, ga.repair_mode
+    order = repair_order(values, weights)
+    population = ini_population(rng, ga.population_size, ga.genome_length)  # Initialize population
+    if repair_mode:
+        population = repair(population, weights, max_weight, order, repair_mode == "fill")
+    best_solution = None  # Store best solution found
+    best_fitness_ever = float('-inf')  # Track highest fitness value
+    
+    # Run genetic algorithm for a defined number of generations
+    for generation in range(ga.generations):
+        fitness_values = fitness(population, values, weights, max_weight)  # Evaluate fitness
+        best_index = np.argmax(fitness_values)  # Find the best genome in this generation
+        
+        # Track the best solution found so far
+        if fitness_values[best_index] > best_fitness_ever:
+            best_fitness_ever = fitness_values[best_index]
+            best_solution = population[best_index].copy()  # Store best genome
+        
+        # Create next generation: population_size // 2 pairs, two offspring each
+        pairs = ga.population_size // 2
+        parents = selection_parents(rng, population, fitness_values, 2 * pairs, ga)
+        offspring1, offspring2 = crossover(rng, parents[:pairs], parents[pairs:], ga.crossover_rate)
+        population = mutate(rng, np.concatenate([offspring1, offspring2]), ga.mutation_rate)
+        if repair_mode:
+            population = repair(population, weights, max_weight, order, repair_mode == "fill")  # Stage after mutate
+        
+        if generation % 10 == 0:
+            print(f"Generation {generation}: Best fitness = {best_fitness_ever}")
+    
+    # Display final best solution
+    print("\nFinal Results:")
+    ga.print_solution(best_solution.astype(int).tolist())
+    print(f"Best fitness achieved: {best_fitness_ever}")
+
+# Run the genetic algorithm if script is executed directly
+if __name__ == "__main__":
+    genetic_algorithm()
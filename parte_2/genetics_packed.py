@@ -0,0 +1,147 @@
+import numpy as np
+
+from genetics import GeneticAlgorithm
+from genetics_numpy import items_to_arrays, selection_parents
+
+# Packed engine: 8 genes per byte, one genome per row of an (N, ceil(L/8)) uint8 matrix.
+# Gene i lives in byte i // 8, bit 7 - i % 8 (np.packbits order).
+
+CHUNK_BYTES = 1 << 26  # Bound on temporary arrays (64 MB) when unpacking rows
+SPARSE_MUTATION_RATE = 1 / 64  # Below this, flips are sampled as positions instead of a dense mask
+
+# Number of bytes needed to store genome_length genes
+def packed_length(genome_length):
+    return (genome_length + 7) // 8
+
+# Mask of the valid bits in the last byte (padding bits stay zero)
+def tail_mask(genome_length):
+    return np.uint8((0xFF << (8 * packed_length(genome_length) - genome_length)) & 0xFF)
+
+# Pack an (N, L) 0/1 matrix and unpack it back
+def pack(population):
+    return np.packbits(population.astype(bool), axis=1)
+
+def unpack(packed, genome_length):
+    return np.unpackbits(packed, axis=-1, count=genome_length)
+
+# Initialize a population with random genomes: random bytes are random bits
+def ini_population(rng, population_size, genome_length):
+    packed = rng.integers(0, 256, (population_size, packed_length(genome_length)), dtype=np.uint8)
+    packed[:, -1] &= tail_mask(genome_length)
+    return packed
+
+# Rows per chunk so an unpacked float64 chunk stays under CHUNK_BYTES
+def _chunk_rows(genome_length):
+    return max(1, CHUNK_BYTES // (8 * genome_length))
+
+# Per-byte lookup tables: tables[j, b] = sum of vector over the bits set in byte value b at position j
+def lookup_tables(vector, genome_length):
+    padded = np.zeros(8 * packed_length(genome_length))
+    padded[:genome_length] = vector
+    patterns = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)  # (256, 8)
+    return (patterns @ padded.reshape(-1, 8).T).T  # (bytes, 256)
+
+# Total value and weight of every genome
+def totals(packed, values, weights, genome_length, tables=None):
+    total_value = np.empty(len(packed))
+    total_weight = np.empty(len(packed))
+    columns = np.arange(packed.shape[1])
+    rows = _chunk_rows(genome_length)
+    if tables is None:
+        value_weight = np.column_stack([values, weights])  # Both totals from one matrix product
+        buffer = np.empty((min(rows, len(packed)), genome_length))  # Reused float copy of the bits
+    for start in range(0, len(packed), rows):
+        chunk = packed[start:start + rows]
+        if tables is None:  # Unpacked dot products
+            bits = buffer[:len(chunk)]
+            np.copyto(bits, unpack(chunk, genome_length))
+            total_value[start:start + rows], total_weight[start:start + rows] = (bits @ value_weight).T
+        else:  # One table lookup per byte
+            value_table, weight_table = tables
+            total_value[start:start + rows] = value_table[columns, chunk].sum(axis=1)
+            total_weight[start:start + rows] = weight_table[columns, chunk].sum(axis=1)
+    return total_value, total_weight
+
+# Compute fitness of every genome, penalizing solutions over the weight limit
+def fitness(packed, values, weights, max_weight, genome_length, tables=None):
+    total_value, total_weight = totals(packed, values, weights, genome_length, tables)
+    excess = total_weight - max_weight
+    return np.where(excess > 0, -excess, total_value)
+
+# One-point crossover on each pair of rows, in place: parents1 becomes child1 and parents2 child2
+def crossover(rng, parents1, parents2, crossover_rate, genome_length):
+    pairs, num_bytes = parents1.shape
+    points = rng.integers(1, genome_length, pairs)  # One random cut per pair
+    points[rng.random(pairs) >= crossover_rate] = 8 * num_bytes  # No crossover: child1 is all parent1
+    cut_bytes, cut_bits = points >> 3, points & 7
+    columns = np.arange(num_bytes)
+    
+    for start in range(0, pairs, _chunk_rows(8 * num_bytes)):
+        stop = start + _chunk_rows(8 * num_bytes)
+        cut_byte = cut_bytes[start:stop, None]
+        # Bits taken from parent1: whole bytes before the cut, high bits of the cut byte
+        boundary = ((0xFF << (8 - cut_bits[start:stop, None])) & 0xFF).astype(np.uint8)
+        mask = np.where(columns < cut_byte, np.uint8(0xFF), np.where(columns == cut_byte, boundary, np.uint8(0)))
+        
+        swap = (parents1[start:stop] ^ parents2[start:stop]) & ~mask  # Bits that differ after the cut
+        parents1[start:stop] ^= swap
+        parents2[start:stop] ^= swap
+    return parents1, parents2
+
+# Apply mutation (random bit flip) in place
+def mutate(rng, packed, mutation_rate, genome_length):
+    population_size, num_bytes = packed.shape
+    if mutation_rate < SPARSE_MUTATION_RATE:
+        # Sample the flipped positions directly: O(flips)
+        flips = rng.binomial(population_size * genome_length, mutation_rate)
+        positions = rng.integers(0, population_size * genome_length, flips)
+        rows, genes = np.divmod(positions, genome_length)
+        bits = (np.uint8(0x80) >> (genes & 7).astype(np.uint8))
+        np.bitwise_xor.at(packed, (rows, genes >> 3), bits)
+        return packed
+    
+    # Dense rates: build the flip mask chunk by chunk and pack it
+    rows = _chunk_rows(genome_length)
+    for start in range(0, population_size, rows):
+        chunk = packed[start:start + rows]
+        chunk ^= np.packbits(rng.random((len(chunk), genome_length)) < mutation_rate, axis=1)
+    return packed
+
+# Main genetic algorithm function; ga (a genetics.GeneticAlgorithm) holds the problem and the settings
+def genetic_algorithm(ga=None, seed=None, use_tables=False):
+    ga = ga or GeneticAlgorithm()
+    rng = np.random.default_rng(seed)
+    values, weights = items_to_arrays(ga.items)
+    max_weight, genome_length = ga.max_weight, ga.genome_length
+    tables = (lookup_tables(values, genome_length), lookup_tables(weights, genome_length)) if use_tables else None
+    population = ini_population(rng, ga.population_size, genome_length)  # Initialize population
+    best_solution = None  # Store best solution found
+    best_fitness_ever = float('-inf')  # Track highest fitness value
+    
+    # Run genetic algorithm for a defined number of generations
+    for generation in range(ga.generations):
+        fitness_values = fitness(population, values, weights, max_weight, genome_length, tables)  # Evaluate fitness
+        best_index = np.argmax(fitness_values)  # Find the best genome in this generation
+        
+        # Track the best solution found so far
+        if fitness_values[best_index] > best_fitness_ever:
+            best_fitness_ever = fitness_values[best_index]
+            best_solution = population[best_index].copy()  # Store best genome
+        
+        # Create next generation: selection copies the parents, crossover and mutation work in place
+        pairs = ga.population_size // 2
+        parents = selection_parents(rng, population, fitness_values, 2 * pairs, ga)
+        crossover(rng, parents[:pairs], parents[pairs:], ga.crossover_rate, genome_length)
+        population = mutate(rng, parents, ga.mutation_rate, genome_length)
+        
+        if generation % 10 == 0:
+            print(f"Generation {generation}: Best fitness = {best_fitness_ever}")
+    
+    # Display final best solution
+    print("\nFinal Results:")
+    ga.print_solution(unpack(best_solution, genome_length).tolist())
+    print(f"Best fitness achieved: {best_fitness_ever}")
+
+# Run the genetic algorithm if script is executed directly
+if __name__ == "__main__":
+    genetic_algorithm()
@@ -0,0 +1,216 @@
+import json
+import time
+
+import numpy as np
+
+# Knapsack instances as contiguous value/weight vectors, loaded from disk or generated
+
+CHUNK_BYTES = 1 << 24  # Text read per parsing step when streaming CSV files
+DEFAULT_RANGE = 1000   # Coefficient range R of the generated classes
+CLASSES = ("uncorrelated", "weakly_correlated", "strongly_correlated", "subset_sum")
+
+# A problem instance: item i is worth values[i] and weighs weights[i]
+class Instance:
+    def __init__(self, values, weights, max_weight):
+        self.values = np.ascontiguousarray(values, dtype=float)
+        self.weights = np.ascontiguousarray(weights, dtype=float)
+        if self.values.shape != self.weights.shape or self.values.ndim != 1:
+            raise ValueError("values and weights must be 1-D arrays of the same length")
+        self.max_weight = float(max_weight)  # Knapsack weight capacity
+
+    def __len__(self):
+        return len(self.values)
+
+    # (value, weight) of item i, like an entry of genetics.ITEMS
+    def __getitem__(self, i):
+        return float(self.values[i]), float(self.weights[i])
+
+    # (value, weight) pairs, for the list-based engine in genetics.py
+    def items(self):
+        return list(zip(self.values.tolist(), self.weights.tolist()))
+
+    def __repr__(self):
+        return f"Instance({len(self)} items, max_weight={self.max_weight:g})"
+
+# Capacity used when a file does not state one: half of the total weight
+def default_capacity(weights, fraction=0.5):
+    return fraction * float(np.sum(weights))
+
+# Comment ("#") or blank line, skipped anywhere in a text file
+def _is_blank_or_comment(line):
+    stripped = line.strip()
+    return not stripped or stripped.startswith("#")
+
+# Read "# capacity=<number>" comments and an optional text header; returns (capacity, first data line, its number)
+def _read_preamble(file, delimiter):
+    capacity = None
+    header_seen = False
+    separator = None if delimiter.isspace() else delimiter  # Whitespace files may mix spaces and tabs
+    for number, line in enumerate(file, start=1):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("#"):
+            key, _, value = stripped.lstrip("#").partition("=")
+            if key.strip().lower() == "capacity":
+                capacity = float(value)
+            continue
+        try:
+            float(stripped.split(separator)[0])
+        except ValueError:
+            if header_seen:
+                raise ValueError(f"{file.name}:{number}: non-numeric row {stripped!r} after the header") from None
+            header_seen = True  # Column names, only allowed on the first row
+            continue
+        return capacity, line, number
+    return capacity, "", 0
+
+# Parse a block of lines into an (n, 2) array; first_number is the file line number of lines[0]
+def _parse_lines(path, lines, first_number, delimiter):
+    rows = [line for line in lines if not _is_blank_or_comment(line)]
+    block = "".join(rows)
+    if not delimiter.isspace():
+        block = block.replace("\r", "").replace("\n", delimiter)
+    try:
+        numbers = np.fromstring(block, sep=delimiter)
+    except ValueError:
+        numbers = None
+    if numbers is not None and len(numbers) == 2 * len(rows):
+        return numbers.reshape(-1, 2)
+
+    # Slow path, only on malformed input: find the first bad line to report it
+    separator = None if delimiter.isspace() else delimiter
+    for offset, line in enumerate(lines):
+        if _is_blank_or_comment(line):
+            continue
+        fields = line.strip().split(separator)
+        try:
+            [float(field) for field in fields]
+        except ValueError:
+            fields = ()
+        if len(fields) != 2:
+            raise ValueError(f"{path}:{first_number + offset}: expected a value and a weight, got {line.strip()!r}")
+    raise ValueError(f"{path}: could not parse lines {first_number}-{first_number + len(lines) - 1}")
+
+# Stream a "value,weight" CSV into two arrays, parsing CHUNK_BYTES of text at a time
+def load_csv(path, max_weight=None, delimiter=","):
+    chunks = []  # (n, 2) float blocks, no per-row Python objects
+    with open(path) as file:
+        capacity, first_line, line_number = _read_preamble(file, delimiter)
+        pending = [first_line] if first_line else []
+        while True:
+            lines = pending + file.readlines(CHUNK_BYTES)  # readlines stops at a line boundary
+            pending = []
+            if not lines:
+                break
+            chunks.append(_parse_lines(path, lines, line_number, delimiter))
+            line_number += len(lines)
+
+    count = sum(len(chunk) for chunk in chunks)
+    if not count:
+        raise ValueError(f"{path}: no data rows")
+    values = np.empty(count)
+    weights = np.empty(count)
+    start = 0
+    for chunk in chunks:  # Split the columns straight into the final vectors
+        values[start:start + len(chunk)] = chunk[:, 0]
+        weights[start:start + len(chunk)] = chunk[:, 1]
+        start += len(chunk)
+    return Instance(values, weights, _capacity(max_weight, capacity, weights))
+
+# Load {"values": [...], "weights": [...], "capacity": C} or {"items": [[v, w], ...], "capacity": C}.
+# json.load reads the whole document into memory: use CSV or .npy for instances too large for that
+def load_json(path, max_weight=None):
+    with open(path) as file:
+        data = json.load(file)
+    if "items" in data:
+        pairs = np.asarray(data["items"], dtype=float).reshape(-1, 2)
+        values, weights = pairs[:, 0], pairs[:, 1]
+    else:
+        values = np.asarray(data["values"], dtype=float)
+        weights = np.asarray(data["weights"], dtype=float)
+    return Instance(values, weights, _capacity(max_weight, data.get("capacity"), weights))
+
+# Load an (n, 2) .npy array (memory-mapped) or a .npz with values, weights and capacity
+def load_npy(path, max_weight=None):
+    if str(path).endswith(".npz"):
+        with np.load(path) as data:
+            capacity = float(data["capacity"]) if "capacity" in data else None
+            return Instance(data["values"], data["weights"], _capacity(max_weight, capacity, data["weights"]))
+    pairs = np.load(path, mmap_mode="r")  # Columns are copied out once, the file is never loaded whole
+    return Instance(pairs[:, 0], pairs[:, 1], _capacity(max_weight, None, pairs[:, 1]))
+
+# Load an instance, choosing the reader by file extension
+def load(path, max_weight=None):
+    name = str(path).lower()
+    if name.endswith(".json"):
+        return load_json(path, max_weight)
+    if name.endswith((".npy", ".npz")):
+        return load_npy(path, max_weight)
+    if name.endswith(".csv"):
+        return load_csv(path, max_weight)
+    return load_csv(path, max_weight, delimiter=" ")  # Whitespace-separated text
+
+# Explicit argument, then the capacity stored in the file, then half of the total weight
+def _capacity(max_weight, stored, weights):
+    if max_weight is not None:
+        return max_weight
+    if stored is not None:
+        return stored
+    return default_capacity(weights)
+
+# Save an instance as .npz (fast reload) or CSV with a capacity comment
+def save(instance, path):
+    if str(path).endswith(".npz"):
+        np.savez(path, values=instance.values, weights=instance.weights, capacity=instance.max_weight)
+        return
+    with open(path, "w") as file:
+        file.write(f"# capacity={instance.max_weight!r}\n")
+        np.savetxt(file, np.column_stack((instance.values, instance.weights)), delimiter=",", fmt="%.17g")
+
+# Seeded instance of one of the classic hard classes (Pisinger), with integer coefficients in [1, R]
+#   uncorrelated:        v ~ U[1, R]
+#   weakly_correlated:   v ~ U[w - R/10, w + R/10], kept >= 1
+#   strongly_correlated: v = w + R/10
+#   subset_sum:          v = w
+def generate(num_items, kind="uncorrelated", coefficient_range=DEFAULT_RANGE, capacity_fraction=0.5, seed=None):
+    if kind not in CLASSES:
+        raise ValueError(f"unknown instance class {kind!r}, expected one of {CLASSES}")
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, coefficient_range + 1, num_items).astype(float)
+    spread = coefficient_range // 10
+    if kind == "uncorrelated":
+        values = rng.integers(1, coefficient_range + 1, num_items).astype(float)
+    elif kind == "weakly_correlated":
+        values = weights + rng.integers(-spread, spread + 1, num_items)
+        np.maximum(values, 1, out=values)
+    elif kind == "strongly_correlated":
+        values = weights + spread
+    else:
+        values = weights.copy()
+    return Instance(values, weights, np.floor(default_capacity(weights, capacity_fraction)))
+
+# Generate every class at a large size and time the generator and the loaders
+def main():
+    import os
+    import tempfile
+
+    num_items = 1_000_000
+    for kind in CLASSES:
+        start = time.perf_counter()
+        instance = generate(num_items, kind, seed=42)
+        print(f"{kind:>20}: {instance} generated in {time.perf_counter() - start:.3f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("instance.csv", "instance.npz"):
+            path = os.path.join(directory, name)
+            save(instance, path)
+            start = time.perf_counter()
+            loaded = load(path)
+            elapsed = time.perf_counter() - start
+            same = np.array_equal(loaded.values, instance.values) and np.array_equal(loaded.weights, instance.weights)
+            print(f"{name:>20}: loaded {loaded} in {elapsed:.3f} s (round trip {'ok' if same else 'MISMATCH'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,24 @@
 import matplotlib.pyplot as plt
 
-from genetics import *
+from genetics import ELITE_COUNT, GeneticAlgorithm, StopCriteria
 
 
-def genetic_algorithm_with_plotting():
-    population = ini_population(POPULATION_SIZE, GENOME_LENGTH)
-    best_solution = None
-    best_fitness_ever = float('-inf')
-    
+def genetic_algorithm_with_plotting(ga=None, evaluator=None, stop=None, cache=None):
+    ga = ga or GeneticAlgorithm()
+
     # Listas para armazenar dados para plotagem
     generation_numbers = []
     best_fitnesses = []
     average_fitnesses = []
     current_fitnesses = []
 
-    for generation in range(GENERATIONS):
-        fitness_values = [fitness(genome) for genome in population]
-        current_best = max(fitness_values)
-        current_avg = sum(fitness_values) / len(fitness_values)
-        
-        current_fitnesses.append(current_best)
-        average_fitnesses.append(current_avg)
+    def record(generation, fitness_values, best_fitness_ever):
         generation_numbers.append(generation)
+        current_fitnesses.append(max(fitness_values))
+        average_fitnesses.append(sum(fitness_values) / len(fitness_values))
+        best_fitnesses.append(best_fitness_ever)
 
-        if current_best > best_fitness_ever:
-            best_fitness_ever = current_best
-            best_index = fitness_values.index(current_best)
-            best_solution = population[best_index].copy()
-
-            # Armazenar dados para plotagem
-            best_fitnesses.append(current_best)
-        else:
-            best_fitnesses.append(best_fitness_ever)
-
-        
-        new_population = []
-        for _ in range(POPULATION_SIZE // 2):
-            parent1 = selection_parents(population, fitness_values)
-            parent2 = selection_parents(population, fitness_values)
-            offspring1, offspring2 = crossover(parent1, parent2)
-            new_population.extend([mutate(offspring1), mutate(offspring2)])
-        
-        population = new_population
-        
-        if generation % 10 == 0:
-            print(f"Generation {generation}: Best fitness = {best_fitness_ever}")
-
+    ga.run(evaluator, stop, cache, on_generation=record)
 
     # Plotando os resultados
     plt.figure(figsize=(12, 6))
@@ -68,11 +41,8 @@ def genetic_algorithm_with_plotting():
     plt.legend()
     plt.tight_layout()
     plt.show()
-    
-    print("\nFinal Results:")
-    print_solution(best_solution)
-    print(f"Best fitness achieved: {best_fitness_ever}")
 
 # Para executar o algoritmo com plotagem:
 if __name__ == "__main__":
-    genetic_algorithm_with_plotting()
\ No newline at end of file
+    ga = GeneticAlgorithm(elitism=ELITE_COUNT)
+    genetic_algorithm_with_plotting(ga, stop=StopCriteria(patience=60))
\ No newline at end of file
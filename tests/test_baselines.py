@@ -0,0 +1,49 @@
+import itertools
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parte_2"))
+from baselines import dynamic_programming, greedy, lp_bound
+from instances import Instance, generate
+
+
+def _brute_force(values, weights, max_weight):
+    best = 0.0
+    for mask in itertools.product((False, True), repeat=len(values)):
+        mask = np.array(mask)
+        if weights[mask].sum() <= max_weight + 1e-9:
+            best = max(best, values[mask].sum())
+    return best
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_dp_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 50, 12).astype(float)
+    weights = rng.integers(1, 30, 12).astype(float)
+    if seed % 2:
+        weights = weights / 10  # one decimal: the automatic scale keeps the DP exact
+    max_weight = weights.sum() / 2
+    solution = dynamic_programming(Instance(values, weights, max_weight), max_weight)
+    assert solution.value == pytest.approx(_brute_force(values, weights, max_weight))
+    assert values[solution.selected].sum() == pytest.approx(solution.value)
+    assert solution.weight <= max_weight + 1e-9
+
+
+@pytest.mark.parametrize("kind", ["uncorrelated", "strongly_correlated", "subset_sum"])
+def test_greedy_and_lp_bracket_the_optimum(kind):
+    instance = generate(60, kind, seed=3)
+    optimum = dynamic_programming(instance, instance.max_weight).value
+    heuristic = greedy(instance, instance.max_weight)
+    assert heuristic.weight <= instance.max_weight
+    assert optimum / 2 <= heuristic.value <= optimum
+    assert optimum <= lp_bound(instance, instance.max_weight) + 1e-9
+
+
+def test_dp_refuses_rows_beyond_the_budget():
+    instance = Instance([1.0, 2.0], [3.0, 4.0], 1e6)
+    with pytest.raises(ValueError, match="max_cells"):
+        dynamic_programming(instance, instance.max_weight, max_cells=1000)
@@ -0,0 +1,25 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from comum.benchmarks import BENCHMARKS
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmarks_survive_pickling(name):
+    # Pools de processos (evaluators, ilhas, renderização) enviam o objetivo por pickle
+    benchmark = BENCHMARKS[name]
+    points = np.random.default_rng(0).uniform(benchmark.lower, benchmark.upper, (5, 7))
+    benchmark(points)  # preenche caches internos antes de serializar
+    clone = pickle.loads(pickle.dumps(benchmark))
+    np.testing.assert_allclose(clone(points), benchmark(points))
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_fmin_is_the_value_at_the_optimum(name):
+    benchmark = BENCHMARKS[name]
+    assert abs(benchmark.fmin(4)) < 1e-3
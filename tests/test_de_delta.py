@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "parte_1", "de"))
+from comum.benchmarks import ackley, griewank, rastrigin, schwefel
+from comum.objective import evaluate
+from de import DifferentialEvo
+
+
+def _de(objective, dimensions=8, F=0.8, probability_recombination=0.3):
+    lower, upper = objective.bounds(dimensions)
+    return DifferentialEvo(F=F, probability_recombination=probability_recombination, fitness=objective,
+                           upperBound=upper, lowerBound=lower, num_individuals=16,
+                           num_dimensions=dimensions, batch=True, maximize=False)
+
+
+@pytest.mark.parametrize("objective", [schwefel, griewank, rastrigin, ackley], ids=lambda f: f.name)
+def test_delta_evaluation_matches_full_evaluation(objective):
+    np.random.seed(0)
+    de = _de(objective)
+    assert de.contributions is not None
+    for _ in range(100):
+        de.optimize()
+    np.testing.assert_allclose(de.fitness_values, evaluate(objective, de.pop), rtol=1e-9, atol=1e-9)
+
+
+def test_delta_products_with_zero_factors():
+    # Fatores cos(x/sqrt(i)) nulos não têm razão novo/antigo: essas linhas refazem o produto
+    np.random.seed(1)
+    de = _de(griewank, dimensions=4)
+    de.pop[:3, 1] = np.pi / 2 * np.sqrt(2)  # cos(x / sqrt(2)) = 0 no eixo 1
+    de.fitness_values = evaluate(griewank, de.pop)
+    de.contributions = griewank.contributions(de.pop)
+    de.contributions[:3, 1, 1] = 0.0  # zero exato, sem resíduo de ponto flutuante
+    de.aggregates = griewank.aggregate(de.contributions)
+
+    trials = de.pop + 1.0
+    mask = np.zeros(de.pop.shape, dtype=bool)
+    mask[:, 1] = True  # troca justamente o fator nulo
+    mask[::2, 3] = True
+    values, rows, dims, terms = de._evaluate_delta(trials, mask)
+    np.testing.assert_allclose(values, evaluate(griewank, np.where(mask, trials, de.pop)), rtol=1e-12, atol=1e-12)
+
+
+def test_large_F_keeps_population_in_bounds():
+    np.random.seed(2)
+    de = _de(schwefel, F=3.0)
+    for _ in range(50):
+        de.optimize()
+        assert np.all(de.pop >= de.lowerBound) and np.all(de.pop <= de.upperBound)
+    np.testing.assert_allclose(de.fitness_values, evaluate(schwefel, de.pop), rtol=1e-9, atol=1e-9)
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "parte_1", "de"))
+from comum.benchmarks import rastrigin
+from comum.evaluators import ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator
+from comum.objective import evaluate
+from de import DifferentialEvo
+
+
+def _norm(point):
+    return float(np.sum(point ** 2) + point[0])
+
+
+def _coordinates(x, y, z):
+    return x - 2 * y + 3 * z
+
+
+EVALUATORS = [
+    SerialEvaluator,
+    lambda: ThreadPoolEvaluator(workers=3, chunksize=4),
+    lambda: ProcessPoolEvaluator(workers=2, chunksize=5),
+]
+
+
+@pytest.mark.parametrize("make_evaluator", EVALUATORS)
+@pytest.mark.parametrize("func", [_norm, rastrigin])
+def test_results_come_back_in_point_order(make_evaluator, func):
+    points = np.random.default_rng(0).uniform(-5, 5, (23, 3))
+    with make_evaluator() as evaluator:
+        np.testing.assert_allclose(evaluate(func, points, evaluator=evaluator), evaluate(func, points))
+
+
+@pytest.mark.parametrize("make_evaluator", EVALUATORS)
+def test_evaluator_honors_unpack(make_evaluator):
+    points = np.random.default_rng(1).uniform(-5, 5, (11, 3))
+    expected = points[:, 0] - 2 * points[:, 1] + 3 * points[:, 2]
+    np.testing.assert_allclose(evaluate(_coordinates, points, unpack=True), expected)
+    with make_evaluator() as evaluator:
+        np.testing.assert_allclose(evaluate(_coordinates, points, unpack=True, evaluator=evaluator), expected)
+
+
+def _run(evaluator=None, asynchronous=False):
+    np.random.seed(0)
+    lower, upper = rastrigin.bounds(4)
+    de = DifferentialEvo(F=0.8, probability_recombination=0.5, fitness=_norm, upperBound=upper,
+                         lowerBound=lower, num_individuals=15, num_dimensions=4, maximize=False,
+                         evaluator=evaluator, asynchronous=asynchronous)
+    for _ in range(10):
+        de.optimize()
+    return de
+
+
+def test_seeded_de_runs_match_across_evaluators():
+    serial = _run()
+    with ThreadPoolEvaluator(workers=3, chunksize=4) as evaluator:
+        pooled = _run(evaluator)
+    np.testing.assert_array_equal(serial.pop, pooled.pop)
+    np.testing.assert_array_equal(serial.fitness_values, pooled.fitness_values)
+
+
+def test_asynchronous_de_keeps_values_aligned():
+    de = _run(asynchronous=True)
+    np.testing.assert_allclose(de.fitness_values, evaluate(_norm, de.pop))
+    assert de.evaluations == 15 * 11
+    with pytest.raises(ValueError):
+        DifferentialEvo(F=0.8, probability_recombination=0.5, fitness=_norm, upperBound=np.ones(2),
+                        lowerBound=-np.ones(2), num_individuals=5, num_dimensions=2, batch=True,
+                        asynchronous=True)
@@ -0,0 +1,106 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parte_2"))
+from fitness_cache import FitnessCache
+from genetics import WEIGHT_TOLERANCE, GeneticAlgorithm, StopCriteria, count_regressions, elite_indexes
+from genetics_numpy import tournament_indexes
+
+
+def _check_totals(ga, genome):
+    value, weight = ga.segment_totals(genome)
+    assert genome.value == pytest.approx(value)
+    assert genome.weight == pytest.approx(weight)
+
+
+def test_repair_is_opt_in():
+    ga = GeneticAlgorithm(seed=0)
+    population = ga.ini_population()
+    assert any(genome.weight > ga.max_weight for genome in population)  # penalty path: infeasible genomes stay
+    assert ga.repair_population(population) is population
+
+
+@pytest.mark.parametrize("mode", ["drop", "fill"])
+def test_repair_makes_every_genome_fit(mode):
+    ga = GeneticAlgorithm(seed=0, repair=mode)
+    population = GeneticAlgorithm(seed=0).ini_population()
+    before = [list(genome) for genome in population]
+    repaired = ga.repair_population(population)
+
+    assert [list(genome) for genome in population] == before  # inputs are never modified
+    for original, genome in zip(population, repaired):
+        _check_totals(ga, genome)
+        assert genome.weight <= ga.max_weight + WEIGHT_TOLERANCE
+        if original.weight <= ga.max_weight and mode == "drop":
+            assert genome is original  # feasible genomes pass through
+        if mode == "fill":  # no unselected item still fits
+            room = ga.max_weight - genome.weight
+            assert all(gene or weight > room + WEIGHT_TOLERANCE for gene, weight in zip(genome, ga.weights))
+
+
+def test_drop_removes_worst_ratio_items_first():
+    items = [(10, 1), (1, 10), (5, 5)]
+    ga = GeneticAlgorithm(items=items, max_weight=6, repair="drop")
+    repaired, = ga.repair_population([ga.make_genome([1, 1, 1])])
+    assert list(repaired) == [1, 0, 1]
+
+
+def test_elitism_never_loses_the_best_fitness():
+    ga = GeneticAlgorithm(generations=60, elitism=2, seed=3)
+    _, best, generation_bests = ga.run(verbose=False)
+    assert count_regressions(generation_bests) == 0
+    assert generation_bests[-1] == best
+
+
+def test_elites_are_carried_unchanged():
+    ga = GeneticAlgorithm(population_size=40, elitism=3, seed=1)
+    population = ga.ini_population()
+    fitness_values = ga.evaluate_population(population)
+    new_population = ga.next_generation(population, fitness_values)
+    elites = elite_indexes(fitness_values, 3)
+    assert len(new_population) == 40
+    assert all(new_population[k] is population[i] for k, i in enumerate(elites))
+
+
+def test_offspring_never_modify_their_parents():
+    ga = GeneticAlgorithm(population_size=40, mutation_rate=0.5, crossover_rate=0.0, elitism=2, seed=2)
+    population = ga.ini_population()
+    snapshot = [(list(genome), genome.value, genome.weight) for genome in population]
+    for _ in range(5):
+        ga.next_generation(population, ga.evaluate_population(population))
+    assert [(list(genome), genome.value, genome.weight) for genome in population] == snapshot
+
+
+def test_mutate_copies_on_first_flip():
+    ga = GeneticAlgorithm(mutation_rate=1.0, seed=0)
+    genome = ga.random_genome()
+    genes = list(genome)
+    mutated = ga.mutate(genome)
+    assert mutated is not genome and list(genome) == genes
+    assert list(mutated) == [1 - gene for gene in genes]
+    _check_totals(ga, mutated)
+    assert GeneticAlgorithm(mutation_rate=0.0).mutate(genome) is genome
+
+
+def test_tournament_winners_are_the_fittest_of_each_row():
+    fitness_values = np.random.default_rng(0).random(50)
+    winners = tournament_indexes(np.random.default_rng(1), fitness_values, 200, 4)
+    competitors = np.random.default_rng(1).integers(0, 50, (200, 4))  # same draws as the operator
+    np.testing.assert_array_equal(fitness_values[winners], fitness_values[competitors].max(axis=1))
+
+    ga = GeneticAlgorithm(selection_method="tournament", tournament_size=4, seed=0)
+    population = ga.ini_population()
+    parents = ga.selection_parents(population, ga.evaluate_population(population), 30)
+    assert len(parents) == 30 and all(any(parent is genome for genome in population) for parent in parents)
+
+
+def test_budget_counts_only_real_fitness_calls():
+    ga = GeneticAlgorithm(population_size=60, generations=30, elitism=2, seed=0)
+    cache = FitnessCache(ga.fitness)
+    stop = StopCriteria()
+    ga.run(stop=stop, cache=cache, verbose=False)
+    assert cache.hits > 0
+    assert stop.report().evaluations == cache.misses
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from comum.gif_writer import GifWriter
+
+
+def _frames(count, height=24, width=32):
+    # Fundo fixo e um quadrado que anda: poucas cores, então a quantização é exata
+    frames = []
+    for i in range(count):
+        frame = np.full((height, width, 4), 255, dtype=np.uint8)
+        frame[2:6, :, :3] = (0, 0, 200)
+        frame[10:16, 2 * i:2 * i + 6, :3] = (200, 30, 30)
+        frames.append(frame)
+    return frames
+
+
+def _read(path):
+    with Image.open(path) as image:
+        frames = [np.asarray(frame.convert("RGB")) for frame in ImageSequence.Iterator(image)]
+        durations = [frame.info["duration"] for frame in ImageSequence.Iterator(image)]
+        return frames, durations, image.size, image.info.get("loop")
+
+
+@pytest.mark.parametrize("palette", ["frame", "first"])
+@pytest.mark.parametrize("delta", [True, False])
+def test_frames_round_trip(tmp_path, palette, delta):
+    path = tmp_path / "out.gif"
+    frames = _frames(6)
+    with GifWriter(path, fps=20, palette=palette, delta=delta) as writer:
+        for frame in frames:
+            writer.append(frame)
+
+    read, durations, size, loop = _read(path)
+    assert writer.written == 6 and len(read) == 6
+    assert durations == [50] * 6
+    assert size == (32, 24) and loop == 0
+    for original, decoded in zip(frames, read):
+        np.testing.assert_array_equal(decoded, original[..., :3])  # o delta recompõe o quadro inteiro
+
+
+def test_every_and_scale(tmp_path):
+    path = tmp_path / "out.gif"
+    frames = _frames(7)
+    with GifWriter(path, fps=10, every=3, scale=0.5) as writer:
+        for frame in frames:
+            writer.append(frame)
+
+    read, durations, size, _ = _read(path)
+    assert (writer.received, writer.written) == (7, 3)
+    assert len(read) == 3 and durations == [100] * 3
+    assert size == (16, 12)
+
+
+def test_repeated_frames_keep_their_duration(tmp_path):
+    path = tmp_path / "out.gif"
+    frame = _frames(1)[0]
+    with GifWriter(path, fps=5) as writer:
+        for _ in range(3):
+            writer.append(frame)
+
+    read, durations, _, _ = _read(path)
+    assert len(read) == 3 and sum(durations) == 600
@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parte_2"))
+from instances import CLASSES, Instance, generate, load, save
+
+
+def _same(a, b):
+    np.testing.assert_array_equal(a.values, b.values)
+    np.testing.assert_array_equal(a.weights, b.weights)
+    assert a.max_weight == b.max_weight
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npz"])
+def test_save_load_round_trip(tmp_path, suffix):
+    instance = generate(50, "weakly_correlated", seed=1)
+    path = tmp_path / f"instance{suffix}"
+    save(instance, path)
+    _same(load(path), instance)
+
+
+def test_load_json_both_layouts(tmp_path):
+    instance = Instance([10, 20, 30], [5, 7, 9], 12)
+    columns, pairs = tmp_path / "columns.json", tmp_path / "pairs.json"
+    columns.write_text(json.dumps({"values": [10, 20, 30], "weights": [5, 7, 9], "capacity": 12}))
+    pairs.write_text(json.dumps({"items": [[10, 5], [20, 7], [30, 9]], "capacity": 12}))
+    _same(load(columns), instance)
+    _same(load(pairs), instance)
+
+
+def test_text_files_skip_blank_and_comment_lines(tmp_path):
+    path = tmp_path / "instance.csv"
+    path.write_text("# capacity=12\nvalue,weight\n10,5\n\n# middle comment\n20,7\n30,9\n\n")
+    _same(load(path), Instance([10, 20, 30], [5, 7, 9], 12))
+
+
+def test_whitespace_files_accept_tabs(tmp_path):
+    path = tmp_path / "instance.txt"
+    path.write_text("10\t5\n20 7\n30\t9\n")
+    _same(load(path, max_weight=12), Instance([10, 20, 30], [5, 7, 9], 12))
+
+
+def test_malformed_row_reports_its_line(tmp_path):
+    path = tmp_path / "instance.csv"
+    path.write_text("value,weight\n10,5\n20,x\n")
+    with pytest.raises(ValueError, match=r":3:"):
+        load(path)
+
+
+def test_file_without_rows_is_an_error(tmp_path):
+    path = tmp_path / "instance.csv"
+    path.write_text("# capacity=3\nvalue,weight\n")
+    with pytest.raises(ValueError, match="no data rows"):
+        load(path)
+
+
+@pytest.mark.parametrize("kind", CLASSES)
+def test_generate_is_seeded(kind):
+    _same(generate(30, kind, seed=7), generate(30, kind, seed=7))
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "parte_1", "de"))
+from comum.benchmarks import schwefel
+from comum.objective import evaluate
+from de import DifferentialEvo
+from islands import _migrate
+
+
+def _island(dimensions: int = 5) -> DifferentialEvo:
+    lower, upper = schwefel.bounds(dimensions)
+    return DifferentialEvo(F=0.8, probability_recombination=0.5, fitness=schwefel,
+                           upperBound=upper, lowerBound=lower, num_individuals=20,
+                           num_dimensions=dimensions, batch=True, maximize=False)
+
+
+def test_migration_keeps_delta_cache_consistent():
+    np.random.seed(0)
+    islands = [_island(), _island()]
+    for de in islands:
+        for _ in range(20):
+            de.optimize()
+
+    _migrate(islands, migrants=3, topology="ring", rng=np.random.default_rng(0))
+
+    # Os testes das linhas migradas devem partir dos termos dos imigrantes
+    for de in islands:
+        np.testing.assert_allclose(schwefel.combine(de.aggregates, de.num_dimensions), de.fitness_values,
+                                   rtol=1e-9, atol=1e-6)
+        for _ in range(50):
+            de.optimize()
+        np.testing.assert_allclose(de.fitness_values, evaluate(schwefel, de.pop), rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(de.aggregates, schwefel.aggregate(schwefel.contributions(de.pop)),
+                                   rtol=1e-9, atol=1e-6)
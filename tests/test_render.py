@@ -0,0 +1,44 @@
+import os
+import sys
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image, ImageSequence
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from comum.render import BlitRenderer, render_frames, render_gif
+
+
+class _PointRenderer(BlitRenderer):
+    # Um ponto que anda na diagonal sobre um fundo fixo
+    def build(self):
+        fig, ax = plt.subplots(figsize=(1.6, 1.2), dpi=50)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        self.point, = ax.plot([0], [0], "ro")
+        self.point.set_animated(True)
+        self.animated.append(self.point)
+        return fig
+
+    def update(self, i):
+        self.point.set_data([i], [i])
+
+
+def test_frames_come_back_in_order():
+    frames = list(render_frames(_PointRenderer(), 6, processes=1))
+    assert len(frames) == 6 and frames[0].shape == (60, 80, 4)
+    assert all(np.any(a != b) for a, b in zip(frames, frames[1:]))
+    np.testing.assert_array_equal(next(render_frames(_PointRenderer(), [3], processes=1)), frames[3])
+
+
+def test_every_keeps_the_animation_length(tmp_path):
+    durations = {}
+    for every in (1, 3):
+        path = tmp_path / f"every_{every}.gif"
+        written = render_gif(_PointRenderer(), 9, path, fps=10, processes=1, every=every)
+        with Image.open(path) as image:
+            durations[every] = [frame.info["duration"] for frame in ImageSequence.Iterator(image)]
+        assert written == len(durations[every]) == 9 // every
+    assert durations[1] == [100] * 9 and durations[3] == [300] * 3